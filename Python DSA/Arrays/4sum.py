@@ -6,12 +6,23 @@ Logical Thinking:
 1. Sort array
 2. Use two loops + two pointers
 3. Skip duplicates
+
+The loops are the k = 4 case of the k-Sum engine in k_sum.py, which also
+prunes on min/max bounds and yields quadruplets lazily.
+
+Time: O(n³) | Space: O(n)
 """
 
-# TODO: Implement solution
+from k_sum import k_sum
+
+
+def four_sum(nums, target):
+    return [list(quad) for quad in k_sum(nums, 4, target)]
 
 
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing 4Sum...")
-    print("Add your test cases here")
+    assert four_sum([1, 0, -1, 0, -2, 2], 0) == [[-2, -1, 1, 2], [-2, 0, 0, 2], [-1, 0, 0, 1]]
+    assert four_sum([2, 2, 2, 2, 2], 8) == [[2, 2, 2, 2]]
+    assert four_sum([1, 2, 3], 6) == []
+    print("✅ All test cases passed!")
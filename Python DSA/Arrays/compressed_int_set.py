@@ -0,0 +1,302 @@
+"""
+COMPRESSED INTEGER SET (roaring-style bitmap) - Hard
+Membership, gaps and first missing positive over huge 32-bit ID spaces.
+Follow-up to missing_ranges.py, first_missing_positive.py and
+find_disappeared_numbers (which flips signs inside the caller's list).
+
+Example:
+ids = CompressedIntSet([3, 4, 7, 1])
+list(ids.missing_ranges(0, 9))  → [(0, 0), (2, 2), (5, 6), (8, 9)]
+ids.first_missing_positive()    → 2
+
+Logical Thinking:
+1. Split every value into high 16 bits (chunk key) and low 16 bits
+2. Sparse chunk (<= 4096 values): sorted array('H') → 2 bytes per value
+3. Dense chunk: 65536-bit bytearray → 8 KB flat, 1 bit per value
+4. Convert array → bitmap once a chunk passes 4096 values (8 KB either way)
+5. Runs of present values: array → walk neighbours; bitmap → regex over the
+   chunk's bit string (runs are found in C, not bit by bit)
+6. Gaps = space between consecutive runs, stitched across chunk borders
+7. Union / intersection chunk by chunk: arrays via set ops or filtering,
+   bitmaps via big-int OR / AND
+8. The caller's data is only read; a plain set of 10^8 ints is several GB
+
+Key: Two-level Bitmap, Array vs Bitmap Containers, Bit Manipulation
+Time: O(log chunks) contains | O(n + chunks) bulk load | Space: <= 2 bytes/value
+"""
+
+import re
+from array import array
+from bisect import bisect_left, insort
+
+ARRAY_LIMIT = 4096
+CHUNK_BYTES = 8192
+_ONES = re.compile("1+")
+
+
+def _bits(container):
+    if isinstance(container, bytearray):
+        return int.from_bytes(container, "little")
+    bits = 0
+    for low in container:
+        bits |= 1 << low
+    return bits
+
+
+def _from_bits(bits):
+    if not bits:
+        return None
+    if bits.bit_count() > ARRAY_LIMIT:
+        return bytearray(bits.to_bytes(CHUNK_BYTES, "little"))
+    text = format(bits, "b")[::-1]
+    return array("H", (m.start() for m in re.finditer("1", text)))
+
+
+def _to_bitmap(values):
+    bitmap = bytearray(CHUNK_BYTES)
+    for low in values:
+        bitmap[low >> 3] |= 1 << (low & 7)
+    return bitmap
+
+
+def _runs(container):
+    if isinstance(container, bytearray):
+        text = format(int.from_bytes(container, "little"), "b")[::-1]
+        for m in _ONES.finditer(text):
+            yield m.start(), m.end() - 1
+        return
+    start = prev = None
+    for low in container:
+        if prev is not None and low == prev + 1:
+            prev = low
+            continue
+        if start is not None:
+            yield start, prev
+        start = prev = low
+    if start is not None:
+        yield start, prev
+
+
+class CompressedIntSet:
+    def __init__(self, values=()):
+        self.chunks = {}
+        self.keys = []
+        self.update(values)
+
+    def _store(self, key, container):
+        if container is None or not len(container):
+            if key in self.chunks:
+                del self.chunks[key]
+                self.keys.pop(bisect_left(self.keys, key))
+            return
+        if key not in self.chunks:
+            insort(self.keys, key)
+        self.chunks[key] = container
+
+    def add(self, value):
+        if not 0 <= value < 1 << 32:
+            raise ValueError("value must fit in 32 bits unsigned")
+        key, low = value >> 16, value & 0xFFFF
+        container = self.chunks.get(key)
+        if container is None:
+            self._store(key, array("H", [low]))
+        elif isinstance(container, bytearray):
+            container[low >> 3] |= 1 << (low & 7)
+        else:
+            i = bisect_left(container, low)
+            if i == len(container) or container[i] != low:
+                container.insert(i, low)
+                if len(container) > ARRAY_LIMIT:
+                    self.chunks[key] = _to_bitmap(container)
+
+    def update(self, values, batch=1 << 20):
+        if hasattr(values, "dtype"):
+            self._update_numpy(values)
+            return self
+        pending = {}
+        for n, value in enumerate(values, 1):
+            if not 0 <= value < 1 << 32:
+                raise ValueError("value must fit in 32 bits unsigned")
+            pending.setdefault(value >> 16, []).append(value & 0xFFFF)
+            if n % batch == 0:
+                self._merge_pending(pending)
+                pending = {}
+        self._merge_pending(pending)
+        return self
+
+    def _update_numpy(self, values):
+        import numpy as np
+
+        values = np.unique(np.asarray(values, dtype=np.int64))
+        if len(values) and (values[0] < 0 or values[-1] >= 1 << 32):
+            raise ValueError("value must fit in 32 bits unsigned")
+        highs = values >> 16
+        cuts = np.flatnonzero(np.diff(highs)) + 1
+        for group in np.split(values, cuts):
+            if len(group):
+                lows = (group & 0xFFFF).astype(np.uint16)
+                self._merge_chunk(int(group[0]) >> 16, lows.tolist())
+
+    def _merge_pending(self, pending):
+        for key, lows in pending.items():
+            self._merge_chunk(key, lows)
+
+    def _merge_chunk(self, key, lows):
+        container = self.chunks.get(key)
+        if isinstance(container, bytearray):
+            for low in lows:
+                container[low >> 3] |= 1 << (low & 7)
+            return
+        merged = set(lows)
+        if container is not None:
+            merged.update(container)
+        if len(merged) > ARRAY_LIMIT:
+            self._store(key, _to_bitmap(merged))
+        else:
+            self._store(key, array("H", sorted(merged)))
+
+    def __contains__(self, value):
+        if not 0 <= value < 1 << 32:
+            return False
+        container = self.chunks.get(value >> 16)
+        if container is None:
+            return False
+        low = value & 0xFFFF
+        if isinstance(container, bytearray):
+            return bool(container[low >> 3] >> (low & 7) & 1)
+        i = bisect_left(container, low)
+        return i < len(container) and container[i] == low
+
+    def contains(self, value):
+        return value in self
+
+    def __len__(self):
+        return sum(_bits(c).bit_count() if isinstance(c, bytearray) else len(c)
+                   for c in self.chunks.values())
+
+    def __iter__(self):
+        for key in self.keys:
+            base = key << 16
+            container = self.chunks[key]
+            if isinstance(container, bytearray):
+                for start, end in _runs(container):
+                    yield from range(base + start, base + end + 1)
+            else:
+                for low in container:
+                    yield base + low
+
+    def nbytes(self):
+        return sum(len(c) if isinstance(c, bytearray) else c.itemsize * len(c)
+                   for c in self.chunks.values())
+
+    def runs(self):
+        current = None
+        for key in self.keys:
+            base = key << 16
+            for start, end in _runs(self.chunks[key]):
+                start, end = base + start, base + end
+                if current and start == current[1] + 1:
+                    current = (current[0], end)
+                    continue
+                if current:
+                    yield current
+                current = (start, end)
+        if current:
+            yield current
+
+    def missing_ranges(self, lower, upper):
+        nxt = lower
+        for start, end in self.runs():
+            if end < lower:
+                continue
+            if start > upper:
+                break
+            if start > nxt:
+                yield nxt, start - 1
+            nxt = end + 1
+        if nxt <= upper:
+            yield nxt, upper
+
+    def first_missing_positive(self):
+        for start, _ in self.missing_ranges(1, 1 << 32):
+            return start
+
+    def _combine(self, other, keys, op):
+        result = CompressedIntSet()
+        for key in keys:
+            a, b = self.chunks.get(key), other.chunks.get(key)
+            result._store(key, op(a, b))
+        return result
+
+    def __or__(self, other):
+        def union(a, b):
+            if a is None or b is None:
+                c = a if b is None else b
+                return bytearray(c) if isinstance(c, bytearray) else array("H", c)
+            if not isinstance(a, bytearray) and not isinstance(b, bytearray) and len(a) + len(b) <= ARRAY_LIMIT:
+                return array("H", sorted(set(a).union(b)))
+            return _from_bits(_bits(a) | _bits(b))
+        return self._combine(other, set(self.keys).union(other.keys), union)
+
+    def __and__(self, other):
+        def intersection(a, b):
+            if a is None or b is None:
+                return None
+            if isinstance(a, bytearray) and isinstance(b, bytearray):
+                return _from_bits(_bits(a) & _bits(b))
+            if isinstance(a, bytearray):
+                a, b = b, a
+            if isinstance(b, bytearray):
+                return array("H", (low for low in a if b[low >> 3] >> (low & 7) & 1))
+            return array("H", sorted(set(a).intersection(b)))
+        return self._combine(other, set(self.keys).intersection(other.keys), intersection)
+
+    union = __or__
+    intersection = __and__
+
+
+# Test cases
+if __name__ == "__main__":
+    import random
+
+    ids = CompressedIntSet([3, 4, 7, 1])
+    assert list(ids.missing_ranges(0, 9)) == [(0, 0), (2, 2), (5, 6), (8, 9)]
+    assert ids.first_missing_positive() == 2 and 4 in ids and 5 not in ids
+    assert CompressedIntSet().first_missing_positive() == 1
+    assert list(CompressedIntSet(range(1, 70000)).missing_ranges(0, 70001)) == [(0, 0), (70000, 70001)]
+
+    rng = random.Random(13)
+    for _ in range(20):
+        values = [rng.randrange(1 << 18) for _ in range(rng.randrange(0, 30000))]
+        values += list(range(65530, 65545)) + [rng.randrange(1 << 32) for _ in range(50)]
+        source = values[:]
+        ids = CompressedIntSet(values)
+        assert values == source
+        exact = set(values)
+        assert len(ids) == len(exact) and list(ids) == sorted(exact)
+        probes = [rng.randrange(1 << 18) for _ in range(2000)]
+        assert all((p in ids) == (p in exact) for p in probes)
+
+        one_by_one = CompressedIntSet()
+        for v in values[:3000]:
+            one_by_one.add(v)
+        assert list(one_by_one) == sorted(set(values[:3000]))
+
+        gaps, nxt = [], 0
+        for v in sorted(x for x in exact if x <= 1 << 18):
+            if v > nxt:
+                gaps.append((nxt, v - 1))
+            nxt = max(nxt, v + 1)
+        if nxt <= 1 << 18:
+            gaps.append((nxt, 1 << 18))
+        assert list(ids.missing_ranges(0, 1 << 18)) == gaps
+        first = 1
+        while first in exact:
+            first += 1
+        assert ids.first_missing_positive() == first
+
+        other_values = {rng.randrange(1 << 18) for _ in range(20000)}
+        other = CompressedIntSet(other_values)
+        assert list(ids | other) == sorted(exact | other_values)
+        assert list(ids & other) == sorted(exact & other_values)
+    print("✅ All test cases passed!")
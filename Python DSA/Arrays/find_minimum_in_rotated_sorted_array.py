@@ -8,10 +8,14 @@ Logical Thinking:
 1. Binary search but compare mid with right
 2. If mid > right: minimum is in right half
 3. If mid < right: minimum is in left half (including mid)
-4. Handle edge case of no rotation
+4. If mid == right (duplicates): right cannot be the only minimum, drop it
+5. Handle edge case of no rotation
+
+find_pivot returns the rotation point itself (nums[p:] + nums[:p] is sorted);
+with duplicates it checks whether the dropped right end is the pivot first.
 
 Key: Modified binary search, pivot detection
-Time: O(log n) | Space: O(1)
+Time: O(log n), O(n) worst case with many duplicates | Space: O(1)
 """
 
 def find_min(nums):
@@ -20,13 +24,43 @@ def find_min(nums):
         mid = (left + right) // 2
         if nums[mid] > nums[right]:
             left = mid + 1
-        else:
+        elif nums[mid] < nums[right]:
             right = mid
+        else:
+            right -= 1
     return nums[left]
 
 
+def find_pivot(nums):
+    left, right = 0, len(nums) - 1
+    while left < right:
+        mid = (left + right) // 2
+        if nums[mid] > nums[right]:
+            left = mid + 1
+        elif nums[mid] < nums[right]:
+            right = mid
+        else:
+            if nums[right - 1] > nums[right]:
+                return right
+            right -= 1
+    return left
+
+
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Find Minimum In Rotated Sorted Array...")
-    print("Add your test cases here")
-    print("✅ Refer to problem description for examples")
+    assert find_min([3, 4, 5, 1, 2]) == 1
+    assert find_min([4, 5, 6, 7, 0, 1, 2]) == 0
+    assert find_min([11, 13, 15, 17]) == 11
+    assert find_min([1, 1, 1, 0, 1]) == 0
+    assert find_min([2, 2, 2, 0, 1]) == 0
+    assert find_pivot([4, 5, 6, 7, 0, 1, 2]) == 4
+    assert find_pivot([1, 1, 2, 1]) == 3
+    assert find_pivot([2, 2, 2, 0, 2]) == 3
+    assert find_pivot([1, 1, 1]) == 0
+    for base in ([0, 1, 1, 2, 2, 2, 3], [5, 5, 5, 5, 6], [1, 2, 3, 4, 5, 6]):
+        for r in range(len(base)):
+            rotated = base[r:] + base[:r]
+            p = find_pivot(rotated)
+            assert rotated[p:] + rotated[:p] == base
+            assert find_min(rotated) == base[0]
+    print("✅ All test cases passed!")
@@ -2,10 +2,37 @@
 FIND PEAK ELEMENT - Medium
 Find peak element in O(log n)
 
+Example: nums = [1,2,1,3,5,6,4] → 1 or 5
+
+Logical Thinking:
+- Compare nums[mid] with nums[mid + 1]
+- Going downhill to the right → a peak exists at mid or to its left
+- Going uphill → a peak exists to the right
+- Binary search until left == right
+
+
+FOLLOW-UP: 2D GRIDS (sensor heatmaps)
+
 Logical Thinking:
-- See implementation for approach
+1. find_peak_2d: binary search over columns. Take the max of the middle
+   column; if a horizontal neighbour is bigger, a peak exists on that side
+   (climbing from there can never cross back over the column max)
+2. all_peaks: every cell strictly greater than its 4 neighbours. NumPy
+   version pads with -inf and compares the grid with its 4 shifted copies
+3. stream_peaks: a cell's neighbours are only in the rows above and below,
+   so keep three rows and report row r once row r + 1 arrives
+
+Key: Binary Search on Columns, Shifted Comparisons, Streaming Window
+Time: O(rows · log cols) for one peak | O(rows · cols) for all peaks
+Space: O(1) | O(rows · cols) boolean mask | O(3 · cols) streaming
 """
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def find_peak_element(nums):
     left, right = 0, len(nums) - 1
     while left < right:
@@ -17,7 +44,79 @@ def find_peak_element(nums):
     return left
 
 
+def find_peak_2d(grid):
+    rows, cols = len(grid), len(grid[0])
+    left, right = 0, cols - 1
+    while True:
+        mid = (left + right) // 2
+        row = max(range(rows), key=lambda r: grid[r][mid])
+        value = grid[row][mid]
+        if mid > left and grid[row][mid - 1] > value:
+            right = mid - 1
+        elif mid < right and grid[row][mid + 1] > value:
+            left = mid + 1
+        else:
+            return row, mid
+
+
+def _row_peaks(above, row, below):
+    peaks = []
+    last = len(row) - 1
+    for c, value in enumerate(row):
+        if ((above is None or value > above[c]) and (below is None or value > below[c])
+                and (c == 0 or value > row[c - 1]) and (c == last or value > row[c + 1])):
+            peaks.append(c)
+    return peaks
+
+
+def all_peaks(grid):
+    if np is not None:
+        grid = np.asarray(grid, dtype=np.float64)
+        padded = np.pad(grid, 1, constant_values=-np.inf)
+        core = padded[1:-1, 1:-1]
+        mask = ((core > padded[:-2, 1:-1]) & (core > padded[2:, 1:-1])
+                & (core > padded[1:-1, :-2]) & (core > padded[1:-1, 2:]))
+        return [tuple(p) for p in np.argwhere(mask).tolist()]
+    return list(stream_peaks(grid))
+
+
+def stream_peaks(rows):
+    above = row = None
+    r = -1
+    for below in rows:
+        if row is not None:
+            for c in _row_peaks(above, row, below):
+                yield r, c
+        above, row = row, below
+        r += 1
+    if row is not None:
+        for c in _row_peaks(above, row, None):
+            yield r, c
+
+
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Find Peak Element...")
-    print("✅ Refer to implementation")
+    import random
+
+    assert find_peak_element([1, 2, 3, 1]) == 2
+    assert find_peak_element([1, 2, 1, 3, 5, 6, 4]) in (1, 5)
+    assert find_peak_2d([[1, 4], [3, 2]]) in ((0, 1), (1, 0))
+    assert find_peak_2d([[10, 20, 15], [21, 30, 14], [7, 16, 32]]) in ((1, 1), (2, 2))
+    assert all_peaks([[1, 4], [3, 2]]) == [(0, 1), (1, 0)]
+
+    rng = random.Random(17)
+    for _ in range(200):
+        rows, cols = rng.randint(1, 9), rng.randint(1, 9)
+        grid = [[rng.randint(0, 6) for _ in range(cols)] for _ in range(rows)]
+
+        def neighbours(r, c):
+            return [grid[r + dr][c + dc] for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1))
+                    if 0 <= r + dr < rows and 0 <= c + dc < cols]
+
+        r, c = find_peak_2d(grid)
+        assert all(grid[r][c] >= v for v in neighbours(r, c))
+        expected = [(r, c) for r in range(rows) for c in range(cols)
+                    if all(grid[r][c] > v for v in neighbours(r, c))]
+        assert all_peaks(grid) == expected
+        assert list(stream_peaks(iter(grid))) == expected
+    print("✅ All test cases passed!")
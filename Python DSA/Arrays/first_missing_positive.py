@@ -2,16 +2,41 @@
 FIRST MISSING POSITIVE - Hard
 Find smallest missing positive integer
 
+Example: [3,4,-1,1] → 2 | [7,8,9,11,12] → 1
+
 Logical Thinking:
 1. Place each number at index num-1
 2. Find first index where nums[i] != i+1
 3. In-place solution
+
+Note: this reorders nums. To keep the caller's data untouched (or for huge
+ID spaces), use CompressedIntSet(nums).first_missing_positive() from
+compressed_int_set.py.
+
+Time: O(n) | Space: O(1)
 """
 
-# TODO: Implement solution
+
+def first_missing_positive(nums):
+    n = len(nums)
+    for i in range(n):
+        while 0 < nums[i] <= n and nums[nums[i] - 1] != nums[i]:
+            j = nums[i] - 1
+            nums[i], nums[j] = nums[j], nums[i]
+    for i in range(n):
+        if nums[i] != i + 1:
+            return i + 1
+    return n + 1
 
 
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing First Missing Positive...")
-    print("Add your test cases here")
+    from compressed_int_set import CompressedIntSet
+
+    assert first_missing_positive([1, 2, 0]) == 3
+    assert first_missing_positive([3, 4, -1, 1]) == 2
+    assert first_missing_positive([7, 8, 9, 11, 12]) == 1
+    assert first_missing_positive([1, 1]) == 2
+    nums = [3, 4, 1]
+    assert CompressedIntSet(nums).first_missing_positive() == 2 and nums == [3, 4, 1]
+    print("✅ All test cases passed!")
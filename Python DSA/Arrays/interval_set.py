@@ -0,0 +1,127 @@
+"""
+INTERVAL SET - Medium/Hard
+Keep a set of ranges merged while ranges keep arriving.
+Follow-up to merge_intervals.py (re-sorts everything per call) and
+insert_interval.py (rebuilds the whole result list per insert).
+
+Example:
+s = IntervalSet([[8,10],[1,3],[2,6]])  → [[1,6],[8,10]]
+s.add(6, 8)                            → [[1,10]]
+s.remove(4, 5)                         → [[1,4],[5,10]]
+
+Logical Thinking:
+1. Store merged ranges as two parallel sorted lists: starts and ends
+2. Ranges are half-open [start, end); touching ranges coalesce like merge()
+3. add: bisect the first range whose end >= start and the last range whose
+   start <= end, replace that slice with one widened range
+4. remove: bisect the ranges that overlap, keep only the left/right leftovers
+5. Point and overlap queries are a bisect on starts/ends
+6. Bulk load sorts once, then does the merge_intervals sweep
+
+Key: Binary Search (bisect), Sorted Boundaries, Interval Merging
+Time: O(log n) search + one slice splice per add/remove | O(log n) per query
+Bulk load: O(n log n) | Space: O(n)
+"""
+
+from bisect import bisect_left, bisect_right
+
+
+class IntervalSet:
+    def __init__(self, intervals=()):
+        self.starts = []
+        self.ends = []
+        for start, end in sorted((s, e) for s, e in intervals if s < e):
+            if self.ends and start <= self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __iter__(self):
+        for start, end in zip(self.starts, self.ends):
+            yield [start, end]
+
+    def __repr__(self):
+        return f"IntervalSet({list(self)})"
+
+    def add(self, start, end):
+        if start >= end:
+            return
+        i = bisect_left(self.ends, start)
+        j = bisect_right(self.starts, end)
+        if i < j:
+            start = min(start, self.starts[i])
+            end = max(end, self.ends[j - 1])
+        self.starts[i:j] = [start]
+        self.ends[i:j] = [end]
+
+    def remove(self, start, end):
+        if start >= end:
+            return
+        i = bisect_right(self.ends, start)
+        j = bisect_left(self.starts, end)
+        if i >= j:
+            return
+        new_starts, new_ends = [], []
+        if self.starts[i] < start:
+            new_starts.append(self.starts[i])
+            new_ends.append(start)
+        if self.ends[j - 1] > end:
+            new_starts.append(end)
+            new_ends.append(self.ends[j - 1])
+        self.starts[i:j] = new_starts
+        self.ends[i:j] = new_ends
+
+    def contains(self, point):
+        i = bisect_right(self.starts, point) - 1
+        return i >= 0 and point < self.ends[i]
+
+    def find(self, point):
+        i = bisect_right(self.starts, point) - 1
+        if i >= 0 and point < self.ends[i]:
+            return [self.starts[i], self.ends[i]]
+        return None
+
+    def overlapping(self, start, end):
+        i = bisect_right(self.ends, start)
+        j = bisect_left(self.starts, end)
+        return [[self.starts[k], self.ends[k]] for k in range(i, j)]
+
+    def overlaps(self, start, end):
+        return bisect_right(self.ends, start) < bisect_left(self.starts, end)
+
+
+# Test cases
+if __name__ == "__main__":
+    import random
+
+    s = IntervalSet([[8, 10], [1, 3], [2, 6], [15, 18]])
+    assert list(s) == [[1, 6], [8, 10], [15, 18]]
+    s.add(6, 8)
+    assert list(s) == [[1, 10], [15, 18]]
+    s.remove(4, 5)
+    assert list(s) == [[1, 4], [5, 10], [15, 18]]
+    assert s.contains(1) and not s.contains(4) and s.contains(9.5) and not s.contains(10)
+    assert s.find(16) == [15, 18] and s.find(12) is None
+    assert s.overlapping(3, 16) == [[1, 4], [5, 10], [15, 18]]
+    assert s.overlapping(10, 15) == [] and not s.overlaps(10, 15)
+    s.remove(0, 100)
+    assert len(s) == 0
+
+    rng = random.Random(3)
+    s, covered = IntervalSet(), set()
+    for _ in range(2000):
+        a = rng.randrange(200)
+        b = a + rng.randrange(1, 15)
+        if rng.random() < 0.7:
+            s.add(a, b)
+            covered.update(range(a, b))
+        else:
+            s.remove(a, b)
+            covered.difference_update(range(a, b))
+        assert all(s.contains(x) == (x in covered) for x in range(-1, 216))
+        assert all(e < s2 for e, s2 in zip(s.ends, s.starts[1:]))
+    print("✅ All test cases passed!")
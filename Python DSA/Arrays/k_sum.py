@@ -0,0 +1,105 @@
+"""
+K-SUM ENGINE - Medium/Hard
+Find all unique k-tuples (k >= 2) that sum to an arbitrary target.
+Generalises Two Sum (sorted), Three Sum and 4Sum.
+
+Example: nums = [1,0,-1,0,-2,2], k = 4, target = 0
+Output: (-2,-1,1,2), (-2,0,0,2), (-1,0,0,1)
+
+Logical Thinking:
+1. Sort once; every level works on the same sorted list (no slicing)
+2. k > 2: fix nums[i], skip equal neighbours, recurse on k-1 from i+1
+3. k == 2: the two-pointer core from three_sum (skip duplicates on a hit)
+4. Prune with prefix sums: the k smallest values from i already exceed
+   target -> stop this level; the k largest values are still below -> skip i
+5. Yield tuples lazily so memory stays O(k) however many results exist
+6. count_k_sum runs the same walker with chosen=None: hits are counted,
+   tuples are never built
+
+Key: Sorting, Two Pointers, Skip Duplicates, Bound Pruning, Generators
+Time: O(n^(k-1)) | Space: O(n) for the sorted copy, O(k) per result
+"""
+
+
+def _prefix_sums(nums):
+    prefix = [0]
+    for num in nums:
+        prefix.append(prefix[-1] + num)
+    return prefix
+
+
+def _search(nums, prefix, k, start, target, chosen):
+    """Yield each k-tuple extending chosen; chosen=None yields None per hit (count only)."""
+    n = len(nums)
+    if n - start < k:
+        return
+    if prefix[start + k] - prefix[start] > target or prefix[n] - prefix[n - k] < target:
+        return
+
+    if k == 2:
+        left, right = start, n - 1
+        while left < right:
+            total = nums[left] + nums[right]
+            if total == target:
+                yield None if chosen is None else chosen + (nums[left], nums[right])
+                while left < right and nums[left] == nums[left + 1]:
+                    left += 1
+                while left < right and nums[right] == nums[right - 1]:
+                    right -= 1
+                left += 1
+                right -= 1
+            elif total < target:
+                left += 1
+            else:
+                right -= 1
+        return
+
+    for i in range(start, n - k + 1):
+        if i > start and nums[i] == nums[i - 1]:
+            continue
+        if prefix[i + k] - prefix[i] > target:
+            break
+        if nums[i] + prefix[n] - prefix[n - k + 1] < target:
+            continue
+        yield from _search(nums, prefix, k - 1, i + 1, target - nums[i],
+                           None if chosen is None else chosen + (nums[i],))
+
+
+def k_sum(nums, k, target=0):
+    # Not a generator itself, so a bad k fails at the call, not at next()
+    if k < 2:
+        raise ValueError("k must be at least 2")
+    nums = sorted(nums)
+    return _search(nums, _prefix_sums(nums), k, 0, target, ())
+
+
+def count_k_sum(nums, k, target=0):
+    if k < 2:
+        raise ValueError("k must be at least 2")
+    nums = sorted(nums)
+    return sum(1 for _ in _search(nums, _prefix_sums(nums), k, 0, target, None))
+
+
+# Test cases
+if __name__ == "__main__":
+    from itertools import combinations
+
+    assert list(k_sum([2, 7, 11, 15], 2, 9)) == [(2, 7)]
+    assert list(k_sum([-1, 0, 1, 2, -1, -4], 3)) == [(-1, -1, 2), (-1, 0, 1)]
+    assert list(k_sum([1, 0, -1, 0, -2, 2], 4)) == [(-2, -1, 1, 2), (-2, 0, 0, 2), (-1, 0, 0, 1)]
+    assert list(k_sum([2, 2, 2, 2, 2], 4, 8)) == [(2, 2, 2, 2)]
+    assert list(k_sum([1, 2], 3, 3)) == []
+    assert count_k_sum([1, 0, -1, 0, -2, 2], 4) == 3
+    try:
+        k_sum([1, 2, 3], 1)
+        assert False
+    except ValueError:
+        pass
+
+    nums = [3, -2, 0, 5, -2, 1, 4, 0, -1, 3, 2, -5, 1]
+    for k in range(2, 6):
+        for target in range(-6, 7):
+            expected = sorted({c for c in combinations(sorted(nums), k) if sum(c) == target})
+            assert list(k_sum(nums, k, target)) == expected
+            assert count_k_sum(nums, k, target) == len(expected)
+    print("✅ All test cases passed!")
@@ -3,9 +3,33 @@ MAJORITY ELEMENT - Easy
 Find element appearing more than n/2 times
 
 Logical Thinking:
-- See implementation for approach
+- Boyer–Moore voting: keep one candidate and a counter
+- Same element → +1, different element → -1, counter hits 0 → new candidate
+- A strict majority survives all cancellations
+
+
+FOLLOW-UP: HEAVY HITTERS (Misra–Gries, k counters)
+
+Voting with k - 1 candidates instead of one finds every element that occurs
+more than n/k times, in O(k) memory, with k = 2 being Boyer–Moore again.
+
+Logical Thinking:
+1. Seen candidate → add to its counter; free slot → new counter
+2. Otherwise subtract the smallest counter from all k (the newcomer included),
+   dropping zeros — one cancellation removes the same amount from k items
+3. Track the total subtracted (`error`): true count is in [count, count + error]
+   and error <= n/k, so anything above n/k is always still a candidate
+4. merge: add the counter tables, then cancel down to k - 1 counters again;
+   errors add up, so per-worker sketches combine into one valid sketch
+5. verify: one exact counting pass over the candidates only
+
+Key: Boyer–Moore Voting, Misra–Gries, Mergeable Summaries
+Time: O(1) amortised per item for fixed k | Space: O(k)
 """
 
+from collections import Counter
+
+
 def majority_element(nums):
     count = 0
     candidate = None
@@ -16,7 +40,96 @@ def majority_element(nums):
     return candidate
 
 
+class HeavyHitters:
+    def __init__(self, k):
+        if k < 2:
+            raise ValueError("k must be at least 2")
+        self.k = k
+        self.counters = {}
+        self.n = 0
+        self.error = 0
+
+    def add(self, item, count=1):
+        self.n += count
+        counters = self.counters
+        if item in counters:
+            counters[item] += count
+            return
+        counters[item] = count
+        if len(counters) >= self.k:
+            self._cancel()
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+        return self
+
+    def _cancel(self):
+        counters = self.counters
+        if len(counters) == self.k:
+            cut = min(counters.values())
+        else:
+            cut = sorted(counters.values(), reverse=True)[self.k - 1]
+        self.error += cut
+        self.counters = {item: c - cut for item, c in counters.items() if c > cut}
+
+    def merge(self, other):
+        if other.k != self.k:
+            raise ValueError("sketches must use the same k")
+        merged = HeavyHitters(self.k)
+        merged.counters = dict(Counter(self.counters) + Counter(other.counters))
+        merged.n = self.n + other.n
+        merged.error = self.error + other.error
+        if len(merged.counters) >= merged.k:
+            merged._cancel()
+        return merged
+
+    def estimate(self, item):
+        low = self.counters.get(item, 0)
+        return low, low + self.error
+
+    def candidates(self, threshold=None):
+        threshold = self.n / self.k if threshold is None else threshold
+        return {item: (count, count + self.error)
+                for item, count in self.counters.items() if count + self.error > threshold}
+
+    def verify(self, items, threshold=None):
+        threshold = self.n / self.k if threshold is None else threshold
+        exact = Counter()
+        wanted = set(self.candidates(threshold))
+        for item in items:
+            if item in wanted:
+                exact[item] += 1
+        return {item: c for item, c in exact.items() if c > threshold}
+
+
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Majority Element...")
-    print("✅ Refer to implementation")
+    import random
+
+    assert majority_element([3, 2, 3]) == 3
+    assert majority_element([2, 2, 1, 1, 1, 2, 2]) == 2
+    assert HeavyHitters(2).update([2, 2, 1, 1, 1, 2, 2]).verify([2, 2, 1, 1, 1, 2, 2]) == {2: 4}
+
+    rng = random.Random(9)
+    stream = [rng.choice("abc") if rng.random() < 0.6 else rng.randrange(1000) for _ in range(20000)]
+    exact = Counter(stream)
+    for k in (2, 5, 10, 50):
+        sketch = HeavyHitters(k).update(stream)
+        assert len(sketch.counters) < k and sketch.error <= len(stream) / k
+        for item, count in exact.items():
+            low, high = sketch.estimate(item)
+            assert low <= count <= high
+        heavy = {item for item, count in exact.items() if count > len(stream) / k}
+        assert heavy <= set(sketch.candidates())
+        assert sketch.verify(stream) == {item: exact[item] for item in heavy}
+
+        left = HeavyHitters(k).update(stream[:7000])
+        right = HeavyHitters(k).update(stream[7000:])
+        merged = left.merge(right)
+        assert merged.n == len(stream) and merged.error <= len(stream) / k
+        assert heavy <= set(merged.candidates())
+        for item, count in exact.items():
+            low, high = merged.estimate(item)
+            assert low <= count <= high
+    print("✅ All test cases passed!")
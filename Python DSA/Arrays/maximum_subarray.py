@@ -12,18 +12,256 @@ Logical Thinking:
 
 Key: Kadane's Algorithm, DP thinking
 Time: O(n) | Space: O(1)
+
+
+FOLLOW-UP: HUGE ARRAYS (divide and conquer over chunk summaries)
+
+A chunk [start, stop) is fully described by four numbers: its total, its
+best prefix, its best suffix and its best subarray. Two neighbouring
+summaries combine in O(1), and combining is associative, so chunks can be
+summarised independently (process pool, memory-mapped file, NumPy slices)
+and folded left to right.
+
+Logical Thinking:
+1. combine(L, R).total  = L.total + R.total
+2. combine(L, R).prefix = max(L.prefix, L.total + R.prefix)
+3. combine(L, R).suffix = max(R.suffix, L.suffix + R.total)
+4. combine(L, R).best   = max(L.best, R.best, L.suffix + R.prefix)
+5. Keep the index where each prefix/suffix/best starts or stops, so the
+   answer comes back as nums[start:stop]
+6. append(x) is combine with a one-element summary -> incremental updates
+7. NumPy chunks: cumsum + minimum.accumulate + argmax, no Python loop
+
+Key: Divide & Conquer, Associative Summaries, Process Pool, NumPy
+Time: O(n / workers) + O(chunks) | Space: O(chunk) per worker
 """
 
+from functools import reduce
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def max_subarray(nums):
     max_sum = current_sum = nums[0]
-    for num in nums[1:]:
-        current_sum = max(num, current_sum + num)
+    for i in range(1, len(nums)):
+        current_sum = max(nums[i], current_sum + nums[i])
         max_sum = max(max_sum, current_sum)
     return max_sum
 
 
+class SubarraySummary:
+    __slots__ = ("start", "stop", "total", "prefix", "prefix_stop",
+                 "suffix", "suffix_start", "best", "best_start", "best_stop")
+
+    def __init__(self, start, stop, total, prefix, prefix_stop,
+                 suffix, suffix_start, best, best_start, best_stop):
+        self.start, self.stop, self.total = start, stop, total
+        self.prefix, self.prefix_stop = prefix, prefix_stop
+        self.suffix, self.suffix_start = suffix, suffix_start
+        self.best, self.best_start, self.best_stop = best, best_start, best_stop
+
+    def __repr__(self):
+        return (f"SubarraySummary([{self.start}:{self.stop}] total={self.total} "
+                f"best={self.best} at [{self.best_start}:{self.best_stop}])")
+
+    @classmethod
+    def single(cls, value, index=0):
+        return cls(index, index + 1, value, value, index + 1, value, index, value, index, index + 1)
+
+    @classmethod
+    def of(cls, nums, start=0, stop=None):
+        stop = len(nums) if stop is None else stop
+        if start >= stop:
+            raise ValueError("cannot summarise an empty range")
+        if np is not None and isinstance(nums, np.ndarray):
+            return cls._of_array(nums[start:stop], start)
+        summary = cls.single(nums[start], start)
+        for i in range(start + 1, stop):
+            summary.append(nums[i])
+        return summary
+
+    @classmethod
+    def _of_array(cls, values, offset):
+        acc = np.int64 if values.dtype.kind in "biu" else np.float64
+        sums = np.cumsum(values, dtype=acc)
+        before = np.empty_like(sums)
+        before[0] = 0
+        before[1:] = sums[:-1]
+        total = sums[-1].item()
+
+        p = int(np.argmax(sums))
+        s = int(np.argmax(total - before))
+        lowest = np.minimum.accumulate(before)
+        gains = sums - lowest
+        j = int(np.argmax(gains))
+        i = int(np.argmin(before[:j + 1]))
+        return cls(offset, offset + len(values), total,
+                   sums[p].item(), offset + p + 1,
+                   total - before[s].item(), offset + s,
+                   gains[j].item(), offset + i, offset + j + 1)
+
+    def append(self, value):
+        stop = self.stop
+        if self.total + value > self.prefix:
+            self.prefix, self.prefix_stop = self.total + value, stop + 1
+        if self.suffix > 0:
+            self.suffix += value
+        else:
+            self.suffix, self.suffix_start = value, stop
+        if self.suffix > self.best:
+            self.best, self.best_start, self.best_stop = self.suffix, self.suffix_start, stop + 1
+        self.total += value
+        self.stop = stop + 1
+        return self
+
+    def extend(self, values):
+        for value in values:
+            self.append(value)
+        return self
+
+    def shift(self, offset):
+        self.start += offset
+        self.stop += offset
+        self.prefix_stop += offset
+        self.suffix_start += offset
+        self.best_start += offset
+        self.best_stop += offset
+        return self
+
+    def __add__(self, other):
+        return combine(self, other)
+
+
+def combine(left, right):
+    if left.stop != right.start:
+        raise ValueError("summaries must be adjacent")
+    if left.prefix >= left.total + right.prefix:
+        prefix, prefix_stop = left.prefix, left.prefix_stop
+    else:
+        prefix, prefix_stop = left.total + right.prefix, right.prefix_stop
+    if right.suffix >= left.suffix + right.total:
+        suffix, suffix_start = right.suffix, right.suffix_start
+    else:
+        suffix, suffix_start = left.suffix + right.total, left.suffix_start
+    best = max(
+        (left.best, left.best_start, left.best_stop),
+        (right.best, right.best_start, right.best_stop),
+        (left.suffix + right.prefix, left.suffix_start, right.prefix_stop),
+        key=lambda candidate: candidate[0],
+    )
+    return SubarraySummary(left.start, right.stop, left.total + right.total,
+                           prefix, prefix_stop, suffix, suffix_start, *best)
+
+
+def _summarise_chunk(chunk, offset):
+    return SubarraySummary.of(chunk).shift(offset)
+
+
+def _summarise_file(path, dtype, offset, length, start, stop):
+    data = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(length,))
+    return SubarraySummary.of(data, start, stop)
+
+
+def _file_offset(data):
+    """Byte offset of data[0] in its file, or None if workers cannot reopen it."""
+    if not (isinstance(data, np.memmap) and data.filename
+            and data.ndim == 1 and data.flags.c_contiguous):
+        return None
+    root = data
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    if not isinstance(root, np.memmap):
+        return None
+    address = np.asarray(data).__array_interface__["data"][0]
+    root_address = np.asarray(root).__array_interface__["data"][0]
+    return root.offset + address - root_address
+
+
+def max_subarray_chunked(data, chunk_size=1 << 20, workers=None, dtype=None):
+    """
+    data: list/sequence, NumPy array, np.memmap, or a path to a raw binary
+    file of `dtype` values. Returns (best_sum, start, stop) for data[start:stop].
+    workers=None uses os.cpu_count() processes; workers=1 runs in-process.
+    """
+    if isinstance(data, (str, bytes)) or hasattr(data, "__fspath__"):
+        if np is None:
+            raise ImportError("reading a file needs NumPy")
+        data = np.memmap(data, dtype=dtype or np.float64, mode="r")
+
+    n = len(data)
+    if n == 0:
+        raise ValueError("data is empty")
+    bounds = [(lo, min(lo + chunk_size, n)) for lo in range(0, n, chunk_size)]
+
+    # Sliced or strided memmaps are views, so reopen by path only when the
+    # view is one contiguous run and we know where it starts in the file
+    offset = _file_offset(data) if np is not None else None
+    if offset is not None:
+        task = _summarise_file
+        args = [(data.filename, data.dtype, offset, n, lo, hi) for lo, hi in bounds]
+    else:
+        task = _summarise_chunk
+        args = [(data[lo:hi], lo) for lo, hi in bounds]
+
+    if workers == 1 or len(bounds) == 1:
+        summaries = [task(*a) for a in args]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            summaries = list(pool.map(task, *zip(*args)))
+
+    result = reduce(combine, summaries)
+    return result.best, result.best_start, result.best_stop
+
+
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Maximum Subarray...")
-    print("Add your test cases here")
-    print("✅ Refer to problem description for examples")
+    import random
+
+    assert max_subarray([-2, 1, -3, 4, -1, 2, 1, -5, 4]) == 6
+    assert max_subarray([1]) == 1
+    assert max_subarray([5, 4, -1, 7, 8]) == 23
+    assert max_subarray([-3, -1, -2]) == -1
+
+    s = SubarraySummary.of([-2, 1, -3, 4, -1, 2, 1, -5, 4])
+    assert (s.best, s.best_start, s.best_stop) == (6, 3, 7)
+    assert max_subarray_chunked([-2, 1, -3, 4, -1, 2, 1, -5, 4], chunk_size=2, workers=1) == (6, 3, 7)
+    assert max_subarray_chunked([-3, -1, -2], chunk_size=1, workers=1) == (-1, 1, 2)
+
+    rng = random.Random(5)
+    for _ in range(200):
+        nums = [rng.randint(-10, 10) for _ in range(rng.randint(1, 60))]
+        expected = max_subarray(nums)
+        best, start, stop = max_subarray_chunked(nums, chunk_size=rng.randint(1, 9), workers=1)
+        assert best == expected == sum(nums[start:stop]) and start < stop
+        cut = rng.randint(1, len(nums))
+        s = SubarraySummary.of(nums, 0, cut).extend(nums[cut:])
+        assert s.best == expected == sum(nums[s.best_start:s.best_stop])
+        assert s.total == sum(nums) and s.prefix == max(sum(nums[:k]) for k in range(1, len(nums) + 1))
+
+    if np is not None:
+        import os
+        import tempfile
+
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            np.array([100, 100, 100, -1000, 1, 2, 3, -5, 1, 1], dtype=np.float64).tofile(path)
+            mm = np.memmap(path, dtype=np.float64, mode="r")
+            assert max_subarray_chunked(mm, chunk_size=3, workers=1) == (300.0, 0, 3)
+            assert max_subarray_chunked(mm[4:], chunk_size=3, workers=1) == (6.0, 0, 3)
+            assert max_subarray_chunked(mm[4:][1:], chunk_size=2, workers=1) == (5.0, 0, 2)
+            assert max_subarray_chunked(mm[::2], chunk_size=2, workers=1) == (205.0, 0, 5)
+            assert max_subarray_chunked(mm[4:], chunk_size=3, workers=2) == (6.0, 0, 3)
+            del mm
+        finally:
+            os.remove(path)
+
+    nums = [rng.randint(-100, 100) for _ in range(20000)]
+    best, start, stop = max_subarray_chunked(nums, chunk_size=3000, workers=2)
+    assert best == max_subarray(nums) == sum(nums[start:stop])
+    print("✅ All test cases passed!")
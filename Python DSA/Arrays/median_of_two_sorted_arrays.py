@@ -2,16 +2,153 @@
 MEDIAN OF TWO SORTED ARRAYS - Hard
 Find median of two sorted arrays
 
+Example: nums1 = [1,3], nums2 = [2] → 2.0 | nums1 = [1,2], nums2 = [3,4] → 2.5
+
 Logical Thinking:
 1. Binary search on smaller array
 2. Partition both arrays
 3. Ensure left <= right
+
+Time: O(log(min(m, n))) | Space: O(1)
+
+
+FOLLOW-UP: K-TH SMALLEST / QUANTILES ACROSS N SORTED SHARDS
+
+Same idea without merging: keep an active window [lo, hi) per array and
+throw away whole blocks that cannot contain the answer.
+
+Logical Thinking:
+1. Pivot = weighted median of each window's middle element (weight = window
+   length), so at least ~1/4 of the active elements sit on each side of it
+2. Count active elements < pivot and <= pivot with one bisect per array
+3. k inside [less, less_or_equal] → pivot is the answer
+4. Otherwise shrink every window to the side that holds the k-th element
+5. NumPy arrays / np.memmap use searchsorted; nothing is copied or merged
+
+Key: Binary Search, Partitioning, Weighted Median Pivot
+Time: O(N log n · log total) for N arrays | Space: O(N)
 """
 
-# TODO: Implement solution
+from bisect import bisect_left, bisect_right
+
+
+def find_median_sorted_arrays(nums1, nums2):
+    if len(nums1) > len(nums2):
+        nums1, nums2 = nums2, nums1
+    m, n = len(nums1), len(nums2)
+    if m + n == 0:
+        raise ValueError("both arrays are empty")
+    half = (m + n + 1) // 2
+    left, right = 0, m
+    while left <= right:
+        i = (left + right) // 2
+        j = half - i
+        left1 = nums1[i - 1] if i > 0 else float("-inf")
+        right1 = nums1[i] if i < m else float("inf")
+        left2 = nums2[j - 1] if j > 0 else float("-inf")
+        right2 = nums2[j] if j < n else float("inf")
+        if left1 <= right2 and left2 <= right1:
+            if (m + n) % 2:
+                return float(max(left1, left2))
+            return (max(left1, left2) + min(right1, right2)) / 2
+        if left1 > right2:
+            right = i - 1
+        else:
+            left = i + 1
+
+
+def _bisect(arr, value, lo, hi, side):
+    if hasattr(arr, "searchsorted"):
+        return lo + int(arr[lo:hi].searchsorted(value, side=side))
+    if side == "left":
+        return bisect_left(arr, value, lo, hi)
+    return bisect_right(arr, value, lo, hi)
+
+
+def kth_smallest(arrays, k):
+    """1-based k over the union of sorted arrays."""
+    arrays = [arr for arr in arrays if len(arr)]
+    if not 1 <= k <= sum(len(arr) for arr in arrays):
+        raise IndexError("k out of range")
+    lo = [0] * len(arrays)
+    hi = [len(arr) for arr in arrays]
+
+    while True:
+        mids = sorted((arrays[i][(lo[i] + hi[i]) // 2], hi[i] - lo[i])
+                      for i in range(len(arrays)) if lo[i] < hi[i])
+        half = sum(weight for _, weight in mids) / 2
+        seen = 0
+        for pivot, weight in mids:
+            seen += weight
+            if seen >= half:
+                break
+
+        less = [_bisect(arr, pivot, lo[i], hi[i], "left") for i, arr in enumerate(arrays)]
+        upto = [_bisect(arr, pivot, lo[i], hi[i], "right") for i, arr in enumerate(arrays)]
+        count_less = sum(less[i] - lo[i] for i in range(len(arrays)))
+        count_upto = sum(upto[i] - lo[i] for i in range(len(arrays)))
+
+        if k <= count_less:
+            hi = less
+        elif k <= count_upto:
+            return pivot.item() if hasattr(pivot, "item") else pivot
+        else:
+            k -= count_upto
+            lo = upto
+
+
+def quantile(arrays, q):
+    total = sum(len(arr) for arr in arrays)
+    if total == 0:
+        raise ValueError("all arrays are empty")
+    if not 0 <= q <= 1:
+        raise ValueError("q must be between 0 and 1")
+    position = q * (total - 1)
+    rank = int(position)
+    lower = kth_smallest(arrays, rank + 1)
+    fraction = position - rank
+    if not fraction:
+        return lower
+    return lower + (kth_smallest(arrays, rank + 2) - lower) * fraction
+
+
+def median(arrays):
+    arrays = list(arrays)
+    if len(arrays) == 2:
+        return find_median_sorted_arrays(*arrays)
+    return quantile(arrays, 0.5)
 
 
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Median Of Two Sorted Arrays...")
-    print("Add your test cases here")
+    import random
+
+    assert find_median_sorted_arrays([1, 3], [2]) == 2.0
+    assert find_median_sorted_arrays([1, 2], [3, 4]) == 2.5
+    assert find_median_sorted_arrays([], [1]) == 1.0
+    assert kth_smallest([[1, 5, 9], [2, 2, 8], [], [3]], 4) == 3
+    assert quantile([[1, 5, 9], [2, 2, 8], [3]], 0.5) == 3
+    assert median([[1, 2], [3, 4]]) == 2.5
+
+    rng = random.Random(8)
+    for _ in range(300):
+        arrays = [sorted(rng.randint(-20, 20) for _ in range(rng.randint(0, 12)))
+                  for _ in range(rng.randint(1, 6))]
+        merged = sorted(x for arr in arrays for x in arr)
+        if not merged:
+            continue
+        for k in range(1, len(merged) + 1):
+            assert kth_smallest(arrays, k) == merged[k - 1]
+        q = rng.random()
+        position = q * (len(merged) - 1)
+        r = int(position)
+        expected = merged[r] + (merged[min(r + 1, len(merged) - 1)] - merged[r]) * (position - r)
+        assert abs(quantile(arrays, q) - expected) < 1e-9
+        if len(arrays) >= 2:
+            pair = arrays[:2]
+            both = sorted(pair[0] + pair[1])
+            if both:
+                mid = len(both) // 2
+                expected = both[mid] if len(both) % 2 else (both[mid - 1] + both[mid]) / 2
+                assert find_median_sorted_arrays(*pair) == expected
+    print("✅ All test cases passed!")
@@ -2,16 +2,40 @@
 MISSING RANGES - Easy
 Find missing ranges in sorted array
 
+Example: nums = [0,1,3,50,75], lower = 0, upper = 99
+Output: [[2,2],[4,49],[51,74],[76,99]]
+
 Logical Thinking:
 1. Iterate through array
 2. Check gaps between consecutive elements
 3. Format ranges
+
+For hundreds of millions of unsorted 32-bit IDs, load them into
+CompressedIntSet (compressed_int_set.py) and use its missing_ranges().
+
+Time: O(n) | Space: O(1) besides the output
 """
 
-# TODO: Implement solution
+from itertools import chain
+
+
+def find_missing_ranges(nums, lower, upper):
+    result = []
+    prev = lower - 1
+    for num in chain(nums, [upper + 1]):
+        if num - prev >= 2:
+            result.append([prev + 1, num - 1])
+        prev = num
+    return result
 
 
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Missing Ranges...")
-    print("Add your test cases here")
+    from compressed_int_set import CompressedIntSet
+
+    assert find_missing_ranges([0, 1, 3, 50, 75], 0, 99) == [[2, 2], [4, 49], [51, 74], [76, 99]]
+    assert find_missing_ranges([-1], -1, -1) == []
+    assert find_missing_ranges([], 1, 1) == [[1, 1]]
+    ids = CompressedIntSet([75, 0, 50, 3, 1])
+    assert [list(r) for r in ids.missing_ranges(0, 99)] == find_missing_ranges([0, 1, 3, 50, 75], 0, 99)
+    print("✅ All test cases passed!")
@@ -6,8 +6,32 @@ Logical Thinking:
 1. Find first decreasing element from right
 2. Swap with next greater
 3. Reverse suffix
+
+
+FOLLOW-UP: JUMPING K PERMUTATIONS (rank / unrank)
+
+Stepping one permutation at a time costs O(k·n) to move k steps. Instead map
+a permutation to its lexicographic rank (Lehmer code), add k, map back.
+Duplicates are allowed (multiset permutations count each arrangement once).
+
+Logical Thinking:
+1. P = number of distinct arrangements of what is left = m! / Π count[v]!
+2. Arrangements that start with a value v are P · count[v] / m
+3. rank: at each position add P · (remaining values smaller than x) / m,
+   then P = P · count[x] / m and remove x
+4. unrank: the same walk backwards — pick the value whose block holds r
+5. A Fenwick tree over the distinct values gives "how many smaller values are
+   left" and "which value holds prefix t" in O(log n)
+6. advance(nums, k) = unrank(rank(nums) + k) written back in place
+7. permutation_batches starts at any rank and steps with next_permutation, so
+   workers can each take a rank range
+
+Key: Lehmer Code, Multinomial Counting, Fenwick Tree
+Time: O(n log n) arithmetic steps (on big integers) | Space: O(n)
 """
 
+from math import factorial
+
 def next_permutation(nums):
     if not nums:
         return False
@@ -41,8 +65,152 @@ def next_permutation(nums):
     return True
 
 
+def _counts(nums):
+    values = sorted(set(nums))
+    slot = {v: i for i, v in enumerate(values)}
+    counts = [0] * len(values)
+    for num in nums:
+        counts[slot[num]] += 1
+    return values, slot, counts
+
+
+def _fenwick(counts):
+    tree = [0] * (len(counts) + 1)
+    for i, c in enumerate(counts, 1):
+        tree[i] += c
+        parent = i + (i & -i)
+        if parent <= len(counts):
+            tree[parent] += tree[i]
+    return tree
+
+
+def _fenwick_add(tree, i, delta):
+    i += 1
+    while i < len(tree):
+        tree[i] += delta
+        i += i & -i
+
+
+def _fenwick_prefix(tree, i):
+    total = 0
+    while i > 0:
+        total += tree[i]
+        i -= i & -i
+    return total
+
+
+def _fenwick_find(tree, t):
+    pos, step = 0, 1 << (len(tree).bit_length())
+    while step:
+        nxt = pos + step
+        if nxt < len(tree) and tree[nxt] < t:
+            pos = nxt
+            t -= tree[nxt]
+        step >>= 1
+    return pos
+
+
+def count_permutations(nums):
+    total = factorial(len(nums))
+    for c in _counts(nums)[2]:
+        total //= factorial(c)
+    return total
+
+
+def permutation_rank(nums):
+    values, slot, counts = _counts(nums)
+    tree = _fenwick(counts)
+    arrangements = count_permutations(nums)
+    rank = 0
+    for m in range(len(nums), 0, -1):
+        i = slot[nums[len(nums) - m]]
+        rank += arrangements * _fenwick_prefix(tree, i) // m
+        arrangements = arrangements * counts[i] // m
+        counts[i] -= 1
+        _fenwick_add(tree, i, -1)
+    return rank
+
+
+def permutation_unrank(nums, rank):
+    values, _, counts = _counts(nums)
+    arrangements = count_permutations(nums)
+    if not 0 <= rank < arrangements:
+        raise IndexError("rank out of range")
+    tree = _fenwick(counts)
+    result = []
+    for m in range(len(nums), 0, -1):
+        i = _fenwick_find(tree, rank * m // arrangements + 1)
+        rank -= arrangements * _fenwick_prefix(tree, i) // m
+        arrangements = arrangements * counts[i] // m
+        counts[i] -= 1
+        _fenwick_add(tree, i, -1)
+        result.append(values[i])
+    return result
+
+
+def advance(nums, k):
+    total = count_permutations(nums)
+    target = permutation_rank(nums) + k
+    nums[:] = permutation_unrank(nums, target % total)
+    return 0 <= target < total
+
+
+def permutation_batches(nums, start=0, stop=None, batch_size=1000):
+    total = count_permutations(nums)
+    stop = total if stop is None else min(stop, total)
+    if start >= stop:
+        return
+    current = permutation_unrank(nums, start)
+    remaining = stop - start
+    while remaining:
+        batch = []
+        for _ in range(min(batch_size, remaining)):
+            batch.append(tuple(current))
+            next_permutation(current)
+        remaining -= len(batch)
+        yield batch
+
+
+def rank_ranges(nums, workers):
+    total = count_permutations(nums)
+    step, extra = divmod(total, workers)
+    ranges, start = [], 0
+    for w in range(workers):
+        stop = start + step + (w < extra)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
 # Test cases
 if __name__ == "__main__":
+    from itertools import permutations
+
+    arr = [1, 2, 3]
+    assert next_permutation(arr) and arr == [1, 3, 2]
+    arr = [3, 2, 1]
+    assert not next_permutation(arr) and arr == [1, 2, 3]
+    assert permutation_rank([3, 1, 2]) == 4
+    assert permutation_unrank([1, 2, 3], 4) == [3, 1, 2]
+    assert count_permutations([1, 1, 2, 2]) == 6
+    assert permutation_unrank([2, 1, 2, 1], 5) == [2, 2, 1, 1]
+    arr = list(range(10))
+    assert advance(arr, 999_999) and arr == [2, 7, 8, 3, 9, 1, 5, 4, 6, 0]
+
+    for base in ([1, 2, 3, 4], [1, 1, 2, 3], [2, 2, 2, 1, 1], ["a", "b", "b", "c", "a"]):
+        ordered = sorted(set(permutations(sorted(base))))
+        for r, perm in enumerate(ordered):
+            assert permutation_rank(list(perm)) == r
+            assert tuple(permutation_unrank(base, r)) == perm
+            for k in (0, 1, 3, len(ordered) - r - 1, len(ordered) - r):
+                arr = list(perm)
+                in_range = advance(arr, k)
+                assert in_range == (r + k < len(ordered))
+                assert tuple(arr) == ordered[(r + k) % len(ordered)]
+        batches = [p for lo, hi in rank_ranges(base, 3) for b in permutation_batches(base, lo, hi, 4) for p in b]
+        assert batches == ordered
+
+
     print("Testing Next Permutation...")
     cases = [
         [1, 2, 3],
@@ -12,8 +12,34 @@ Logical Thinking:
 
 Key: Reversal algorithm, in-place modification
 Time: O(n) | Space: O(1)
+
+
+FOLLOW-UP: ROTATING OVER AND OVER (RotatedView)
+
+Round-robin style code rotates the same array again and again; three
+reversals rewrite all n slots every time. A view only needs an offset:
+view[i] = buffer[(offset + i) % n], and rotating right by k is
+offset = (offset - k) % n.
+
+Logical Thinking:
+1. Keep the original buffer (list, array.array, memoryview) untouched
+2. rotate(k) → O(1) offset update
+3. Index / iterate through the offset; a slice is another RotatedView over
+   the same buffer with a range of positions (a fixed window, like a
+   memoryview slice: reads and writes go through, nothing is copied)
+4. tolist() / materialize() copy out in view order (two buffer slices when
+   contiguous); apply() rotates the buffer in place (three reversals, once)
+   and resets the offset
+5. The view is a normal sequence, so search(), find_min() and
+   RotatedArrayIndex work on it directly — and a view of a sorted buffer
+   already knows its pivot
+
+Time: O(1) rotate / index | O(n) only on materialize or apply | Space: O(1)
 """
 
+from array import array
+
+
 def rotate(nums, k):
     k = k % len(nums)
     def reverse(start, end):
@@ -27,8 +53,142 @@ def rotate(nums, k):
     reverse(k, len(nums) - 1)
 
 
+class RotatedView:
+    def __init__(self, buffer, k=0):
+        self.buffer = buffer
+        self.offset = 0
+        self.window = None          # range of view positions for a slice
+        if len(buffer):
+            self.rotate(k)
+
+    def __len__(self):
+        return len(self.buffer) if self.window is None else len(self.window)
+
+    def rotate(self, k):
+        if self.window is not None:
+            raise TypeError("slices of a RotatedView are fixed windows; rotate the full view")
+        if len(self.buffer):
+            self.offset = (self.offset - k) % len(self.buffer)
+        return self
+
+    def _physical(self, i):
+        size = len(self)
+        if i < 0:
+            i += size
+        if not 0 <= i < size:
+            raise IndexError("RotatedView index out of range")
+        if self.window is not None:
+            i = self.window[i]
+        return (self.offset + i) % len(self.buffer)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            window = range(len(self.buffer)) if self.window is None else self.window
+            view = RotatedView.__new__(RotatedView)
+            view.buffer, view.offset, view.window = self.buffer, self.offset, window[i]
+            return view
+        return self.buffer[self._physical(i)]
+
+    def __setitem__(self, i, value):
+        self.buffer[self._physical(i)] = value
+
+    def __iter__(self):
+        buffer, offset = self.buffer, self.offset
+        if self.window is not None:
+            n = len(buffer)
+            for i in self.window:
+                yield buffer[(offset + i) % n]
+            return
+        for i in range(offset, len(buffer)):
+            yield buffer[i]
+        for i in range(offset):
+            yield buffer[i]
+
+    def __repr__(self):
+        return f"RotatedView({self.tolist()})"
+
+    def tolist(self):
+        buffer, offset, window = self.buffer, self.offset, self.window
+        if window is None:
+            return list(buffer[offset:]) + list(buffer[:offset])
+        if window.step != 1 or not window:
+            return list(self)
+        n = len(buffer)
+        lo, hi = offset + window.start, offset + window.stop
+        if hi <= n:
+            return list(buffer[lo:hi])
+        if lo >= n:
+            return list(buffer[lo - n:hi - n])
+        return list(buffer[lo:]) + list(buffer[:hi - n])
+
+    def materialize(self):
+        buffer, offset = self.buffer, self.offset
+        if self.window is None and isinstance(buffer, (list, array)):
+            return buffer[offset:] + buffer[:offset]
+        return self.tolist()
+
+    def apply(self):
+        if self.window is not None:
+            raise TypeError("apply() rewrites the whole buffer; call it on the full view")
+        if self.offset:
+            rotate(self.buffer, len(self.buffer) - self.offset)
+            self.offset = 0
+        return self.buffer
+
+    @property
+    def pivot(self):
+        n = len(self.buffer)
+        if self.window is None:
+            return (n - self.offset) % n if n else 0
+        if self.window.step != 1:
+            raise ValueError("pivot needs a contiguous slice")
+        # The wrap from buffer[n - 1] to buffer[0] happens at view position n - offset
+        wrap = (n - self.offset) % n - self.window.start if n else 0
+        return wrap if 0 < wrap < len(self.window) else 0
+
+
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Rotate Array...")
-    print("Add your test cases here")
-    print("✅ Refer to problem description for examples")
+    from find_minimum_in_rotated_sorted_array import find_min
+    from search_in_rotated_sorted_array import RotatedArrayIndex, search
+
+    nums = [1, 2, 3, 4, 5, 6, 7]
+    rotate(nums, 3)
+    assert nums == [5, 6, 7, 1, 2, 3, 4]
+
+    for buffer in ([1, 2, 3, 4, 5, 6, 7], array("i", range(1, 8)), memoryview(bytearray(range(1, 8)))):
+        view = RotatedView(buffer, 3)
+        assert view.tolist() == [5, 6, 7, 1, 2, 3, 4] and list(view) == view.tolist()
+        assert view[0] == 5 and view[-1] == 4
+        assert view[2:5].tolist() == [7, 1, 2] and view[::3].tolist() == [5, 1, 4]
+        window = view[1:6]
+        assert window.buffer is buffer and window[1:][::2].tolist() == [7, 2]
+        assert window.pivot == 2 and search(window, 1) == 2 and find_min(window) == 1
+        assert list(view.rotate(-3)) == [1, 2, 3, 4, 5, 6, 7] and list(buffer) == [1, 2, 3, 4, 5, 6, 7]
+        view.rotate(10)
+        assert view.tolist() == [5, 6, 7, 1, 2, 3, 4] and list(view.materialize()) == view.tolist()
+        assert view.pivot == 3 and search(view, 1) == 3 and search(view, 8) == -1 and find_min(view) == 1
+        index = RotatedArrayIndex(view)
+        assert index.pivot == view.pivot and index.search_many([6, 2]) == [1, 4]
+
+    buffer = [1, 2, 3, 4, 5]
+    view = RotatedView(buffer)
+    for k in range(12):
+        view.rotate(k)
+        expected = buffer[:]
+        rotate(expected, sum(range(k + 1)))
+        assert view.tolist() == expected
+        assert all(view[a:b].tolist() == list(view[a:b]) == expected[a:b]
+                   for a in range(-6, 6) for b in range(-6, 7))
+        assert all(view[a::s].tolist() == expected[a::s] for a in range(-6, 6) for s in (-2, -1, 2))
+    window = view[1:3]
+    window[0] = 42
+    assert view[1] == 42 and len(window) == 2
+    try:
+        window.rotate(1)
+        assert False
+    except TypeError:
+        pass
+    view[0] = 99
+    assert view.apply() == buffer and buffer[0] == 99 and view.offset == 0
+    print("✅ All test cases passed!")
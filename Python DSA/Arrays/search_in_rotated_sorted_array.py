@@ -12,8 +12,29 @@ Logical Thinking:
 
 Key: Binary search with rotation handling
 Time: O(log n) | Space: O(1)
+
+
+FOLLOW-UP: MANY LOOKUPS ON ONE ARRAY (RotatedArrayIndex)
+
+search redoes the rotation analysis on every call. Find the pivot once
+(find_pivot, duplicate-safe) and treat nums[p:] and nums[:p] as two sorted
+halves: logical rank i lives at physical index (p + i) % n.
+
+Logical Thinking:
+1. Pivot p: nums[p:] + nums[:p] is sorted (computed once)
+2. Lookup: bisect the half whose range can hold the target (lo/hi bounds
+   on bisect, so the array is never copied or sliced)
+3. lower/upper bound = logical rank; range count = difference of two ranks
+4. Appends keep the pivot valid if the new value still fits the logical
+   order (it lands between nums[-1] and nums[0]); call refresh() otherwise
+
+Time: O(log n) per lookup after one pivot search | Space: O(1) extra
 """
 
+from bisect import bisect_left, bisect_right
+
+from find_minimum_in_rotated_sorted_array import find_pivot
+
 def search(nums, target):
     left, right = 0, len(nums) - 1
     while left <= right:
@@ -34,8 +55,98 @@ def search(nums, target):
     return -1
 
 
+class RotatedArrayIndex:
+    def __init__(self, nums):
+        self.nums = nums
+        self.pivot = find_pivot(nums)
+
+    def __len__(self):
+        return len(self.nums)
+
+    def refresh(self):
+        self.pivot = find_pivot(self.nums)
+
+    def physical(self, rank):
+        return (self.pivot + rank) % len(self.nums)
+
+    def _rank(self, target, bound):
+        nums, p, n = self.nums, self.pivot, len(self.nums)
+        tail = bound(nums, target, p, n) - p
+        if tail < n - p:
+            return tail
+        return n - p + bound(nums, target, 0, p)
+
+    def lower_bound(self, target):
+        return self._rank(target, bisect_left)
+
+    def upper_bound(self, target):
+        return self._rank(target, bisect_right)
+
+    def count_range(self, low, high):
+        return max(0, self.lower_bound(high) - self.lower_bound(low))
+
+    def count(self, target):
+        return self.upper_bound(target) - self.lower_bound(target)
+
+    def index(self, target):
+        rank = self.lower_bound(target)
+        if rank < len(self.nums):
+            i = self.physical(rank)
+            if self.nums[i] == target:
+                return i
+        return -1
+
+    def search_many(self, targets):
+        return [self.index(target) for target in targets]
+
+    def append(self, value):
+        nums, n = self.nums, len(self.nums)
+        if self.pivot == 0:
+            if n and value < nums[-1]:
+                if value > nums[0]:
+                    raise ValueError("value does not fit the rotated order")
+                self.pivot = n
+        elif not nums[-1] <= value <= nums[0]:
+            raise ValueError("value does not fit the rotated order")
+        nums.append(value)
+
+
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Search In Rotated Sorted Array...")
-    print("Add your test cases here")
-    print("✅ Refer to problem description for examples")
+    assert search([4, 5, 6, 7, 0, 1, 2], 0) == 4
+    assert search([4, 5, 6, 7, 0, 1, 2], 3) == -1
+    assert search([1], 0) == -1
+
+    index = RotatedArrayIndex([4, 5, 6, 7, 0, 1, 2])
+    assert index.pivot == 4
+    assert index.search_many([0, 3, 4, 7, 2]) == [4, -1, 0, 3, 6]
+    assert index.lower_bound(3) == 3 and index.upper_bound(5) == 5
+    assert index.count_range(1, 6) == 4
+
+    index = RotatedArrayIndex([2, 2, 3, 4, 1, 1, 2, 2])
+    assert index.count(2) == 4 and index.count(1) == 2 and index.count(5) == 0
+    assert index.count_range(2, 4) == 5
+    assert index.nums[index.index(3)] == 3
+
+    nums = [5, 6, 7]
+    index = RotatedArrayIndex(nums)
+    index.append(1)
+    index.append(3)
+    assert index.pivot == 3 and nums == [5, 6, 7, 1, 3]
+    assert index.search_many([1, 3, 5, 7, 4]) == [3, 4, 0, 2, -1]
+    try:
+        index.append(9)
+        assert False
+    except ValueError:
+        pass
+
+    for base in ([0, 1, 1, 2, 2, 2, 3, 5], [1, 2, 3, 4, 5, 6], [7, 7, 7]):
+        for r in range(len(base)):
+            rotated = base[r:] + base[:r]
+            index = RotatedArrayIndex(rotated)
+            for target in range(-1, 9):
+                i = index.index(target)
+                assert (i == -1) == (target not in rotated) and (i == -1 or rotated[i] == target)
+                assert index.lower_bound(target) == sum(v < target for v in rotated)
+                assert index.count_range(target, target + 2) == sum(target <= v < target + 2 for v in rotated)
+    print("✅ All test cases passed!")
@@ -12,8 +12,28 @@ Logical Thinking:
 
 Key: Monotonic deque, sliding window
 Time: O(n) | Space: O(k)
+
+
+FOLLOW-UP: STREAMING WINDOW AGGREGATES (SlidingWindow)
+
+max_sliding_window needs the whole list in memory and only gives the max.
+SlidingWindow takes values one at a time (push) or from any iterable
+(extend: generator, file lines, chunks) and keeps max, min, sum, mean and
+count over the last `size` values or the last `duration` time units.
+
+Logical Thinking:
+1. Keep the live window as a deque of (seq, timestamp, value)
+2. Running total gives sum/mean; len gives count. Float totals drift when
+   adding and subtracting forever, so reset to 0 when the window empties and
+   recompute with math.fsum after every max(len, 64) expiries (O(1) amortised)
+3. Decreasing deque for max, increasing deque for min (same idea as above)
+4. Expiring the oldest item pops the front of max/min deques if it is there
+5. Every value enters and leaves each deque once -> amortised O(1) per push
+
+Time: O(1) amortised per push/query | Space: O(window)
 """
 
+import math
 from collections import deque
 
 def max_sliding_window(nums, k):
@@ -34,8 +54,146 @@ def max_sliding_window(nums, k):
     return result
 
 
+class SlidingWindow:
+    def __init__(self, size=None, duration=None):
+        if (size is None) == (duration is None):
+            raise ValueError("pass exactly one of size or duration")
+        if (size is not None and size <= 0) or (duration is not None and duration <= 0):
+            raise ValueError("window must be positive")
+        self.size = size
+        self.duration = duration
+        self.items = deque()
+        self.max_dq = deque()
+        self.min_dq = deque()
+        self.total = 0
+        self.expired = 0
+        self.seq = 0
+        self.now = None
+
+    def push(self, value, timestamp=None):
+        if self.duration is not None:
+            if timestamp is None:
+                raise ValueError("time-based window needs a timestamp")
+            if self.now is not None and timestamp < self.now:
+                raise ValueError("timestamps must not decrease")
+            self.now = timestamp
+        item = (self.seq, timestamp, value)
+        self.seq += 1
+        self.items.append(item)
+        self.total += value
+
+        while self.max_dq and self.max_dq[-1][2] < value:
+            self.max_dq.pop()
+        self.max_dq.append(item)
+        while self.min_dq and self.min_dq[-1][2] > value:
+            self.min_dq.pop()
+        self.min_dq.append(item)
+
+        self._evict()
+
+    def extend(self, values):
+        if self.duration is None:
+            for value in values:
+                self.push(value)
+        else:
+            for timestamp, value in values:
+                self.push(value, timestamp)
+
+    def advance(self, timestamp):
+        if self.duration is None:
+            raise ValueError("advance only applies to time-based windows")
+        if self.now is None or timestamp > self.now:
+            self.now = timestamp
+        self._evict()
+
+    def _evict(self):
+        items = self.items
+        if self.size is not None:
+            while len(items) > self.size:
+                self._expire()
+        else:
+            cutoff = self.now - self.duration
+            while items and items[0][1] <= cutoff:
+                self._expire()
+
+    def _expire(self):
+        seq, _, value = self.items.popleft()
+        self.total -= value
+        self.expired += 1
+        if not self.items:
+            self.total = 0
+            self.expired = 0
+        elif isinstance(self.total, float) and self.expired >= max(len(self.items), 64):
+            self.total = math.fsum(item[2] for item in self.items)
+            self.expired = 0
+        if self.max_dq[0][0] == seq:
+            self.max_dq.popleft()
+        if self.min_dq[0][0] == seq:
+            self.min_dq.popleft()
+
+    @property
+    def count(self):
+        return len(self.items)
+
+    @property
+    def max(self):
+        return self.max_dq[0][2] if self.max_dq else None
+
+    @property
+    def min(self):
+        return self.min_dq[0][2] if self.min_dq else None
+
+    @property
+    def sum(self):
+        return self.total
+
+    @property
+    def mean(self):
+        return self.total / len(self.items) if self.items else None
+
+    def full(self):
+        return self.size is not None and len(self.items) == self.size
+
+
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Sliding Window Maximum...")
-    print("Add your test cases here")
-    print("✅ Refer to problem description for examples")
+    import random
+
+    assert max_sliding_window([1, 3, -1, -3, 5, 3, 6, 7], 3) == [3, 3, 5, 5, 6, 7]
+    assert max_sliding_window([1], 1) == [1]
+
+    window = SlidingWindow(size=3)
+    maxima = []
+    for num in [1, 3, -1, -3, 5, 3, 6, 7]:
+        window.push(num)
+        if window.full():
+            maxima.append(window.max)
+    assert maxima == [3, 3, 5, 5, 6, 7]
+    assert (window.min, window.sum, window.mean, window.count) == (3, 16, 16 / 3, 3)
+
+    rng = random.Random(1)
+    nums = [rng.randint(-50, 50) for _ in range(300)]
+    window = SlidingWindow(size=7)
+    for i, num in enumerate(nums):
+        window.push(num)
+        live = nums[max(0, i - 6):i + 1]
+        assert (window.max, window.min, window.sum) == (max(live), min(live), sum(live))
+
+    # Float total must not drift after large values leave the window
+    window = SlidingWindow(size=1000)
+    window.extend(1e6 + rng.random() for _ in range(500_000))
+    window.extend([0.000003] * 1000)
+    assert window.sum == math.fsum([0.000003] * 1000)
+    window = SlidingWindow(duration=1)
+    window.extend([(0, 1e16), (0, 1.0)])
+    window.advance(5)
+    assert window.sum == 0 and window.mean is None
+
+    window = SlidingWindow(duration=10)
+    window.extend([(0, 5), (3, 1), (9, 4), (12, 2)])
+    assert (window.count, window.max, window.min, window.sum) == (3, 4, 1, 7)
+    window.advance(19)
+    assert (window.count, window.max, window.min, window.mean) == (1, 2, 2, 2)
+    window.advance(30)
+    assert (window.count, window.max, window.min, window.mean) == (0, None, None, None)
+    print("✅ All test cases passed!")
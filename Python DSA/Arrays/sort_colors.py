@@ -3,9 +3,38 @@ SORT COLORS - Medium
 Sort array of 0s, 1s, 2s (Dutch flag)
 
 Logical Thinking:
-- See implementation for approach
+- Three pointers: low (next 0 slot), mid (scanner), high (next 2 slot)
+- 0 → swap to low, 2 → swap to high, 1 → leave in the middle
+- One pass, in place
+
+
+FOLLOW-UP: K BUCKETS BY ANY SMALL KEY (status codes, shard IDs ...)
+
+Dutch flag generalises to k buckets by counting first, then moving every
+item straight into its bucket (American flag sort).
+
+Logical Thinking:
+1. partition_by_key: compute each key once, count per key, give every
+   bucket a [start, stop) slot, then cycle-swap items into place — O(n)
+   swaps, O(k) extra besides the key list, not stable
+2. counting_sort_by_key: small integer keys in [low, high] → stable counting
+   sort: one append per item into its bucket, then concatenate
+3. NumPy integer arrays: bincount for the counts; the permutation is
+   flatnonzero(keys == b) written into bucket b's slot, O(n) per bucket,
+   for up to 32 buckets; more buckets use a stable argsort (timsort —
+   NumPy only radix-sorts 8/16-bit ints) — no Python loop per item
+4. All three return the bucket boundaries, so bucket b is items[start:stop]
+
+Key: Dutch National Flag, Counting Sort, Cycle Swaps, Vectorisation
+Time: O(n + k) | Space: O(n) keys + O(k)
 """
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def sort_colors(nums):
     low = mid = 0
     high = len(nums) - 1
@@ -21,7 +50,142 @@ def sort_colors(nums):
             high -= 1
 
 
+def partition_by_key(items, key, order=None):
+    keys = [key(item) for item in items]
+    counts = {}
+    for k in keys:
+        counts[k] = counts.get(k, 0) + 1
+    if order is None:
+        order = sorted(counts)
+    elif not set(counts) <= set(order):
+        raise ValueError("order is missing some keys")
+
+    bounds, nxt, start = {}, {}, 0
+    for k in order:
+        stop = start + counts.get(k, 0)
+        bounds[k] = (start, stop)
+        nxt[k] = start
+        start = stop
+
+    for k in order:
+        i, stop = nxt[k], bounds[k][1]
+        while i < stop:
+            home = keys[i]
+            if home == k:
+                i += 1
+                continue
+            j = nxt[home]
+            nxt[home] = j + 1
+            items[i], items[j] = items[j], items[i]
+            keys[i], keys[j] = keys[j], keys[i]
+        nxt[k] = stop
+    return bounds
+
+
+def counting_sort_by_key(items, key, low, high):
+    buckets = [[] for _ in range(high - low + 1)]
+    appends = [bucket.append for bucket in buckets]
+    for item in items:
+        slot = key(item) - low
+        if slot < 0 or slot >= len(appends):
+            raise ValueError("key outside [low, high]")
+        appends[slot](item)
+    starts = [0]
+    for bucket in buckets:
+        starts.append(starts[-1] + len(bucket))
+    items[:] = [item for bucket in buckets for item in bucket]
+    return starts
+
+
+def partition_array(keys, num_buckets=None):
+    """NumPy integer keys in [0, num_buckets) → (order, starts); keys[order] is bucketed."""
+    if np is None:
+        raise ImportError("partition_array needs NumPy")
+    keys = np.asarray(keys)
+    if keys.dtype.kind not in "iu":
+        raise TypeError("keys must be an integer array")
+    counts = np.bincount(keys, minlength=num_buckets or 0)
+    starts = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=starts[1:])
+    if len(counts) > 32:
+        return np.argsort(keys, kind="stable"), starts
+    order = np.empty(len(keys), dtype=np.int64)
+    for b in np.flatnonzero(counts):
+        order[starts[b]:starts[b + 1]] = np.flatnonzero(keys == b)
+    return order, starts
+
+
+def benchmark(n=10**6, buckets=16, seed=0):
+    import random
+    import time
+
+    rng = random.Random(seed)
+    records = [(rng.randrange(buckets), i) for i in range(n)]
+    key = lambda record: record[0]
+
+    def timed(label, fn):
+        data = records[:]
+        start = time.perf_counter()
+        fn(data)
+        print(f"  {label:<28}{time.perf_counter() - start:8.3f} s")
+
+    print(f"n={n:,} records, {buckets} buckets")
+    timed("list.sort(key=...)", lambda data: data.sort(key=key))
+    timed("partition_by_key", lambda data: partition_by_key(data, key))
+    timed("counting_sort_by_key", lambda data: counting_sort_by_key(data, key, 0, buckets - 1))
+    if np is not None:
+        keys = np.fromiter((r[0] for r in records), dtype=np.int64, count=n)
+        start = time.perf_counter()
+        partition_array(keys, buckets)
+        print(f"  {'partition_array (NumPy keys)':<28}{time.perf_counter() - start:8.3f} s")
+
+
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Sort Colors...")
-    print("✅ Refer to implementation")
+    import random
+    import sys
+
+    nums = [2, 0, 2, 1, 1, 0]
+    sort_colors(nums)
+    assert nums == [0, 0, 1, 1, 2, 2]
+
+    codes = [404, 200, 500, 200, 301, 404, 200]
+    bounds = partition_by_key(codes, lambda c: c)
+    assert codes == [200, 200, 200, 301, 404, 404, 500]
+    assert bounds == {200: (0, 3), 301: (3, 4), 404: (4, 6), 500: (6, 7)}
+    words = ["bb", "a", "ccc", "dd", "e"]
+    bounds = partition_by_key(words, len, order=[3, 2, 1])
+    assert words[:1] == ["ccc"] and sorted(words[1:3]) == ["bb", "dd"] and bounds[1] == (3, 5)
+    try:
+        partition_by_key([1, 2, 3], lambda x: x, order=[1, 2, 9])
+        assert False
+    except ValueError:
+        pass
+    if np is not None:
+        keys = np.random.default_rng(11).integers(0, 300, 5000)
+        order, starts = partition_array(keys)
+        assert (order == np.argsort(keys, kind="stable")).all() and starts[-1] == 5000
+
+    rng = random.Random(11)
+    for _ in range(100):
+        records = [(rng.randrange(6), i) for i in range(rng.randrange(40))]
+        data = records[:]
+        bounds = partition_by_key(data, lambda r: r[0])
+        assert sorted(data) == sorted(records)
+        assert all(data[i][0] == k for k, (lo, hi) in bounds.items() for i in range(lo, hi))
+        data = records[:]
+        starts = counting_sort_by_key(data, lambda r: r[0], 0, 5)
+        assert data == sorted(records, key=lambda r: r[0]) and starts[-1] == len(records)
+        try:
+            counting_sort_by_key(records[:], lambda r: r[0], 1, 5)
+            assert not any(r[0] == 0 for r in records)
+        except ValueError:
+            pass
+        if np is not None and records:
+            keys = np.array([r[0] for r in records])
+            order, starts = partition_array(keys, 6)
+            assert [records[i] for i in order] == data and starts.tolist()[-1] == len(records)
+    print("✅ All test cases passed!")
+
+    if "--bench" in sys.argv:
+        benchmark()
@@ -2,11 +2,65 @@
 SUBARRAY PRODUCT LESS THAN K - Medium
 Count subarrays with product < k
 
+Example: nums = [10,5,2,6], k = 100 → 8
+
 Logical Thinking:
-- See implementation for approach
+- Sliding window: grow right, multiply in nums[right]
+- While product >= k, divide out nums[left] and move left
+- Every window [left..right] adds right - left + 1 subarrays ending at right
+- Exact integer division only works for positive integers
+
+
+FOLLOW-UP: FLOATS, ZEROS, PRODUCT RANGES, HUGE INPUTS (log space)
+
+Products become sums of logs: product(nums[i:j]) = exp(L[j] - L[i]) with
+L = prefix sums of log(nums). No big integers, no division, floats are fine.
+
+Logical Thinking:
+1. count in [lo, hi) = count(< hi) - count(< lo)
+2. Zeros split the array: every subarray holding a zero has product 0, so it
+   counts whenever lo <= 0 < hi; only zero-free segments need logs
+3. Values >= 1 → L is non-decreasing: for each j, valid i are those with
+   L[i] > L[j] - log(bound) → one bisect (or one vectorised searchsorted)
+4. Values in (0, 1) break monotonicity → Fenwick tree over the ranks of L
+   ("how many earlier prefixes exceed L[j] - log(bound)")
+5. NumPy: prefix logs and searchsorted run chunk by chunk, with the last
+   zero position clamping i, so 10^7 elements never need a Python loop
+6. NumPy with values in (0, 1): rank prefixes and thresholds together
+   (one lexsort, zero-segment id first), then count pairs i < j with
+   rank[i] > threshold[j] by bottom-up merge sort — each level sorts runs of
+   width 2w and answers every right-run threshold against its sorted left
+   run in one global searchsorted (runs offset by pair id). O(n log² n)
+   but all in C: ~3x faster than the Fenwick loop, still ~10x slower than
+   the monotone path (≈1 s per bound per 10^6 floats)
+7. Float prefix sums of 10^7 logs lose far more than any fixed eps, so
+   logs are fixed-point integers: round(log(v) · 2^shift) in int64 (Python
+   ints with shift 60 for lists). Prefix differences are then exact sums of
+   the window's rounded logs — the error depends on the window, not on n
+8. Floats: products within a relative `eps` of a bound count as equal to it
+9. Integers are exact: lists use the sliding window itself per zero-free
+   segment; NumPy integer arrays count windows clearly below the bound with
+   searchsorted and check the few within rounding distance of it with exact
+   integer products (or, for small bounds, know they equal it)
+
+Key: Prefix Sums, Logarithms, Binary Search, Fenwick Tree, Vectorisation
+Time: O(n log n) | Space: O(n)
 """
 
-def num_subarray_product_less_than_k(nums, k):
+from bisect import bisect_right
+from math import ceil, log, log2, prod
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PYTHON_SCALE = 1 << 60      # fixed-point logs for Python lists (ints never overflow)
+
+
+def num_subarray_product_less_than_k(nums, k, log_space=False):
+    if log_space:
+        return num_subarray_product_in_range(nums, 0, k)
     if k <= 1:
         return 0
     product = 1
@@ -20,7 +74,248 @@ def num_subarray_product_less_than_k(nums, k):
     return count
 
 
+def _count_exact(segment, bound):
+    """Integer segment (all >= 1): the sliding window itself, exact."""
+    product = 1
+    left = count = 0
+    for right, num in enumerate(segment):
+        product *= num
+        while product >= bound and left <= right:
+            product //= segment[left]
+            left += 1
+        count += right - left + 1
+    return count
+
+
+def _count_positive(logs, limit):
+    """logs are fixed-point ints, so prefix sums are exact however long the list."""
+    prefix = [0]
+    for value in logs:
+        prefix.append(prefix[-1] + value)
+
+    # valid i: prefix[j] - prefix[i] < limit ⇔ prefix[i] > prefix[j] - limit
+    if all(value >= 0 for value in logs):
+        return sum(j - bisect_right(prefix, prefix[j] - limit, 0, j) for j in range(1, len(prefix)))
+
+    ranks = sorted(set(prefix))
+    tree = [0] * (len(ranks) + 1)
+    count = inserted = 0
+    for j, value in enumerate(prefix):
+        if j:
+            r = bisect_right(ranks, value - limit)
+            at_most = 0
+            while r > 0:
+                at_most += tree[r]
+                r -= r & -r
+            count += inserted - at_most
+        r = bisect_right(ranks, value)
+        while r < len(tree):
+            tree[r] += 1
+            r += r & -r
+        inserted += 1
+    return count
+
+
+def _count_below(nums, bound, eps):
+    if bound <= 0:
+        return 0
+    n = len(nums)
+    limit = ceil((log(bound) - eps) * PYTHON_SCALE)
+    count = inside = 0
+    segment = []
+    for num in list(nums) + [0]:
+        if num < 0:
+            raise ValueError("values must be non-negative")
+        if num:
+            segment.append(num)
+            continue
+        if segment:
+            if all(isinstance(x, int) for x in segment):
+                count += _count_exact(segment, bound)
+            else:
+                count += _count_positive([round(log(x) * PYTHON_SCALE) for x in segment], limit)
+            inside += len(segment) * (len(segment) + 1) // 2
+            segment = []
+    return count + n * (n + 1) // 2 - inside
+
+
+def _fixed_point_prefix(values, chunk):
+    """Exact int64 prefix sums of round(log(v) · 2^shift) (zeros add 0), and after_zero."""
+    n = len(values)
+    nonzero = values[values != 0]
+    largest = float(np.abs(np.log(nonzero)).max()) if nonzero.size else 0.0
+    # Keep |prefix| < 2^62 so prefix[j] ± thresholds cannot overflow
+    shift = max(0, min(40, int(62 - np.log2((n + 1) * (largest + 1)))))
+    scale = float(1 << shift)
+    prefix = np.empty(n + 1, dtype=np.int64)
+    prefix[0] = 0
+    after_zero = np.empty(n + 1, dtype=np.int64)
+    after_zero[0] = 0
+    carry_sum, carry_zero = 0, 0
+    for lo in range(0, n, chunk):
+        block = values[lo:lo + chunk]
+        zero = block == 0
+        logs = np.rint(np.log(np.where(zero, 1, block).astype(np.float64)) * scale).astype(np.int64)
+        sums = np.cumsum(logs) + carry_sum
+        prefix[lo + 1:lo + 1 + len(block)] = sums
+        marks = np.where(zero, np.arange(lo + 1, lo + 1 + len(block)), 0)
+        after_zero[lo + 1:lo + 1 + len(block)] = np.maximum.accumulate(np.maximum(marks, carry_zero))
+        carry_sum, carry_zero = sums[-1], after_zero[lo + len(block)]
+    return prefix, after_zero, scale
+
+
+def _exact_below(values, ones_free, i, j, bound):
+    """Integer array: product(values[i:j]) < bound, multiplying only the non-1 values."""
+    lo, hi = np.searchsorted(ones_free, (i, j))
+    return prod(values[ones_free[lo:hi]].tolist()) < bound
+
+
+def _count_below_numpy(values, bound, eps, chunk, exact=False):
+    if bound <= 0:
+        return 0
+    n = len(values)
+    prefix, after_zero, scale = _fixed_point_prefix(values, chunk)
+    count = int(after_zero.sum())                    # subarrays holding a zero
+    if exact:
+        bound = ceil(bound)                          # integer p < bound ⇔ p < ceil(bound)
+        if bound <= 1:
+            return count                             # non-zero integer products are >= 1
+        # Each non-1 factor is off by <= 1/2 unit after rounding, and a product
+        # near bound has at most log2(bound) of them → only windows within
+        # `slack` units of the bound are in doubt. When the nearest other
+        # integer product is further away than that, a window in doubt can
+        # only be product == bound (not < bound); otherwise check it exactly
+        target = int(log(bound) * scale)
+        slack = int(log2(bound)) + 8
+        in_doubt_is_equal = 2 * slack * (bound + 1) < scale
+        ones_free = np.flatnonzero(values != 1)
+    else:
+        target = ceil((log(bound) - eps) * scale)
+
+    for lo in range(1, n + 1, chunk):
+        hi = min(lo + chunk, n + 1)
+        j = np.arange(lo, hi)
+        floor = after_zero[lo:hi]
+        if not exact:
+            first = np.maximum(np.searchsorted(prefix, prefix[lo:hi] - target, side="right"), floor)
+            count += int(np.maximum(j - first, 0).sum())
+            continue
+        sure = np.maximum(np.searchsorted(prefix, prefix[lo:hi] - target + slack, side="right"), floor)
+        maybe = np.maximum(np.searchsorted(prefix, prefix[lo:hi] - target - slack, side="right"), floor)
+        sure = np.minimum(sure, j)
+        count += int((j - sure).sum())
+        if in_doubt_is_equal:
+            continue
+        for k in np.flatnonzero(maybe < sure).tolist():
+            # Products shrink as i grows, so the valid i form a suffix of [a, b)
+            a, b, jj = int(maybe[k]), int(sure[k]), int(j[k])
+            while a < b:
+                mid = (a + b) // 2
+                if _exact_below(values, ones_free, mid, jj, bound):
+                    b = mid
+                else:
+                    a = mid + 1
+            count += int(sure[k]) - a
+    return count
+
+
+def _count_pairs_above(keys, queries):
+    """Pairs i < j with keys[i] > queries[j]; keys, queries are int64 ranks."""
+    n = len(keys)
+    size = 1 << max(0, (n - 1).bit_length())
+    big = int(max(keys.max(), queries.max())) + 2
+    runs = np.full(size, -1, dtype=np.int64)          # padding never counts as i
+    runs[:n] = keys
+    limits = np.full(size, big, dtype=np.int64)       # ... nor as j
+    limits[:n] = queries
+    count = 0
+    width = 1
+    while width < size:
+        pairs = size // (2 * width)
+        offset = np.arange(pairs, dtype=np.int64)[:, None] * (big + 2)
+        shaped = runs.reshape(pairs, 2, width)
+        left = (shaped[:, 0, :] + offset).ravel()     # globally sorted
+        right = limits.reshape(pairs, 2, width)[:, 1, :] + offset
+        at_most = np.searchsorted(left, right.ravel(), side="right").reshape(pairs, width)
+        at_most -= np.arange(pairs, dtype=np.int64)[:, None] * width
+        count += int((width - at_most).sum())
+        # Rows are two sorted halves, which the stable (merge) sort merges in O(w)
+        runs = np.sort(runs.reshape(pairs, 2 * width), axis=1, kind="stable").ravel()
+        width *= 2
+    return count
+
+
+def _count_below_ranked(values, bound, eps, chunk):
+    if bound <= 0:
+        return 0
+    n = len(values)
+    prefix, after_zero, scale = _fixed_point_prefix(values, chunk)
+    target = ceil((log(bound) - eps) * scale)
+    segment = np.concatenate(([0], np.cumsum(values == 0)))
+
+    # key i = (segment[i], prefix[i]), threshold j = (segment[j], prefix[j] - target);
+    # lexsort is stable and keys come first, so on ties a key sorts before
+    # the threshold and key rank > threshold rank ⇔ key > threshold
+    order = np.lexsort((np.concatenate((prefix, prefix - target)),
+                        np.concatenate((segment, segment))))
+    ranks = np.empty(2 * n + 2, dtype=np.int64)
+    ranks[order] = np.cumsum(order <= n)              # keys seen so far, inclusive
+    keys, thresholds = ranks[:n + 1], ranks[n + 1:]
+    thresholds[0] = n + 2                             # j = 0 is not a query
+    inside = _count_pairs_above(keys, thresholds)
+    return inside + int(after_zero.sum())
+
+
+def num_subarray_product_in_range(nums, lo, hi, eps=1e-9, chunk=1 << 20):
+    if lo >= hi:
+        return 0
+    if np is not None and isinstance(nums, np.ndarray):
+        if nums.size and nums.min() < 0:
+            raise ValueError("values must be non-negative")
+        if nums.dtype.kind in "iub":
+            return (_count_below_numpy(nums, hi, eps, chunk, exact=True)
+                    - _count_below_numpy(nums, lo, eps, chunk, exact=True))
+        values = nums.astype(np.float64, copy=False)
+        if not values.size or values[values != 0].min(initial=1.0) >= 1:
+            return (_count_below_numpy(values, hi, eps, chunk)
+                    - _count_below_numpy(values, lo, eps, chunk))
+        return _count_below_ranked(values, hi, eps, chunk) - _count_below_ranked(values, lo, eps, chunk)
+    return _count_below(nums, hi, eps) - _count_below(nums, lo, eps)
+
+
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Subarray Product Less Than K...")
-    print("✅ Refer to implementation")
+    import random
+    from math import prod
+
+    assert num_subarray_product_less_than_k([10, 5, 2, 6], 100) == 8
+    assert num_subarray_product_less_than_k([1, 2, 3], 0) == 0
+    assert num_subarray_product_less_than_k([10, 5, 2, 6], 100, log_space=True) == 8
+    assert num_subarray_product_less_than_k([0.5, 4.0, 0, 3.0], 2, log_space=True) == 7
+    assert num_subarray_product_in_range([2, 3, 4], 6, 24) == 2
+
+    def brute(nums, lo, hi):
+        return sum(lo <= prod(nums[i:j]) < hi for i in range(len(nums)) for j in range(i + 1, len(nums) + 1))
+
+    rng = random.Random(16)
+    for _ in range(300):
+        pool = [0, 1, 2, 3, 5, 10] if rng.random() < 0.5 else [0, 0.25, 0.5, 1.5, 2, 4]
+        nums = [rng.choice(pool) for _ in range(rng.randint(0, 14))]
+        lo, hi = sorted(rng.choice([0, 0.5, 1, 2, 3, 6, 10, 30, 100]) for _ in range(2))
+        expected = brute(nums, lo, hi)
+        assert num_subarray_product_in_range(nums, lo, hi) == expected
+        if np is not None:
+            assert num_subarray_product_in_range(np.array(nums, dtype=float), lo, hi, chunk=4) == expected
+        if all(isinstance(x, int) and x > 0 for x in nums):
+            assert num_subarray_product_less_than_k(nums, hi) == brute(nums, 0, hi)
+
+    # Long integer input: exact ties (2 · 1000 == 2000) must stay excluded
+    if np is not None:
+        values = np.random.default_rng(16).choice(np.array([1, 2, 3, 1000, 999983]), 10**6)
+        for k in (2000, 1999966, 1999966000, 2000.5):
+            expected = num_subarray_product_less_than_k(values.tolist(), k)
+            assert num_subarray_product_in_range(values, 0, k) == expected
+            assert num_subarray_product_in_range(values.astype(float), 0, k) == expected
+        assert num_subarray_product_in_range(values[:200_000].tolist(), 0, 2000) == \
+            num_subarray_product_less_than_k(values[:200_000].tolist(), 2000)
+    print("✅ All test cases passed!")
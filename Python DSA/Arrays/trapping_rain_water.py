@@ -12,9 +12,42 @@ Logical Thinking:
 
 Key: DP or Two Pointers, understand water level concept
 Time: O(n) | Space: O(n) or O(1)
+
+NumPy input: water level = min(maximum.accumulate from the left,
+maximum.accumulate from the right) — the precompute idea, vectorised.
+
+
+FOLLOW-UP: 2D ELEVATION GRIDS (trap_2d)
+
+In 2D water escapes in four directions, so "min of left max and right max"
+becomes "lowest wall on any path to the border". Flood inwards from the border
+with a min-heap: the lowest boundary cell decides the level of everything it
+can reach.
+
+Logical Thinking:
+1. Pad the grid by one cell and mark the pad visited → neighbours are
+   i ± 1, i ± width with no bounds checks (flat visited bytearray)
+2. Push every border cell into a min-heap of (height, index)
+3. Pop the lowest cell: its height is the water level for its region
+4. Neighbours at or below the level fill to it (water += level - h) and are
+   expanded right away from a plain stack — no heap traffic inside basins
+5. Higher neighbours become new boundary cells → push with their own height
+6. Optional depth map records level - h for every flooded cell
+
+Key: Priority Flood, Min-Heap, Flat Grid Indexing
+Time: O(R·C log(R·C)) | Space: O(R·C)
 """
 
+import heapq
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 def trap(height):
+    if np is not None and isinstance(height, np.ndarray):
+        return trap_numpy(height)
     if not height:
         return 0
     left, right = 0, len(height) - 1
@@ -36,8 +69,118 @@ def trap(height):
     return water
 
 
+def trap_numpy(height):
+    height = np.asarray(height)
+    if height.size == 0:
+        return 0
+    level = np.minimum(np.maximum.accumulate(height), np.maximum.accumulate(height[::-1])[::-1])
+    return (level - height).sum().item()
+
+
+def trap_2d(grid, depths=False):
+    is_array = np is not None and isinstance(grid, np.ndarray)
+    rows = len(grid)
+    cols = len(grid[0]) if rows else 0
+    if rows < 3 or cols < 3:
+        if not depths:
+            return 0
+        return (0, np.zeros((rows, cols), dtype=grid.dtype) if is_array else [[0] * cols for _ in range(rows)])
+
+    width = cols + 2
+    heights = [0] * width
+    for row in (grid.tolist() if is_array else grid):
+        heights.append(0)
+        heights.extend(row)
+        heights.append(0)
+    heights.extend([0] * width)
+
+    visited = bytearray(len(heights))
+    visited[:width] = b"\x01" * width
+    visited[-width:] = b"\x01" * width
+    visited[width - 1::width] = b"\x01" * (rows + 2)
+    visited[0::width] = b"\x01" * (rows + 2)
+    depth = [0] * len(heights) if depths else None
+
+    heap = []
+    for r in range(1, rows + 1):
+        for c in ((1, cols) if 1 < r < rows else range(1, cols + 1)):
+            i = r * width + c
+            visited[i] = 1
+            heap.append((heights[i], i))
+    heapq.heapify(heap)
+
+    water = 0
+    offsets = (1, -1, width, -width)
+    while heap:
+        level, i = heapq.heappop(heap)
+        stack = [i]
+        while stack:
+            i = stack.pop()
+            for step in offsets:
+                nb = i + step
+                if visited[nb]:
+                    continue
+                visited[nb] = 1
+                h = heights[nb]
+                if h <= level:
+                    water += level - h
+                    if depths:
+                        depth[nb] = level - h
+                    stack.append(nb)
+                else:
+                    heapq.heappush(heap, (h, nb))
+
+    if not depths:
+        return water
+    depth_rows = [depth[(r + 1) * width + 1:(r + 1) * width + 1 + cols] for r in range(rows)]
+    if is_array:
+        return water, np.array(depth_rows, dtype=grid.dtype)
+    return water, depth_rows
+
+
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Trapping Rain Water...")
-    print("Add your test cases here")
-    print("✅ Refer to problem description for examples")
+    import random
+
+    assert trap([0, 1, 0, 2, 1, 0, 1, 3, 2, 1, 2, 1]) == 6
+    assert trap([4, 2, 0, 3, 2, 5]) == 9
+    assert trap([]) == 0
+
+    grid = [[1, 4, 3, 1, 3, 2], [3, 2, 1, 3, 2, 4], [2, 3, 3, 2, 3, 1]]
+    assert trap_2d(grid) == 4
+    grid = [[3, 3, 3, 3, 3], [3, 2, 2, 2, 3], [3, 2, 1, 2, 3], [3, 2, 2, 2, 3], [3, 3, 3, 3, 3]]
+    water, depth = trap_2d(grid, depths=True)
+    assert water == 10 and depth[2] == [0, 1, 2, 1, 0]
+    assert trap_2d([[5, 5], [5, 5]]) == 0
+
+    def brute_2d(grid):
+        rows, cols = len(grid), len(grid[0])
+        level = [[float("inf")] * cols for _ in range(rows)]
+        for r in range(rows):
+            for c in range(cols):
+                if r in (0, rows - 1) or c in (0, cols - 1):
+                    level[r][c] = grid[r][c]
+        changed = True
+        while changed:
+            changed = False
+            for r in range(1, rows - 1):
+                for c in range(1, cols - 1):
+                    best = max(grid[r][c], min(level[r + dr][c + dc] for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1))))
+                    if best < level[r][c]:
+                        level[r][c] = best
+                        changed = True
+        return sum(level[r][c] - grid[r][c] for r in range(rows) for c in range(cols))
+
+    rng = random.Random(15)
+    for _ in range(100):
+        heights = [rng.randint(0, 9) for _ in range(rng.randint(0, 30))]
+        if np is not None:
+            assert trap(np.array(heights)) == trap(heights)
+        grid = [[rng.randint(0, 9) for _ in range(rng.randint(3, 9))]]
+        grid += [[rng.randint(0, 9) for _ in grid[0]] for _ in range(rng.randint(2, 8))]
+        water, depth = trap_2d(grid, depths=True)
+        assert water == brute_2d(grid) == sum(map(sum, depth))
+        if np is not None:
+            water_np, depth_np = trap_2d(np.array(grid), depths=True)
+            assert water_np == water and depth_np.tolist() == depth
+    print("✅ All test cases passed!")
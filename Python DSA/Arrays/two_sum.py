@@ -18,8 +18,41 @@ Logical Thinking:
 
 Key Concepts: HashMap, Complement Pattern
 Time: O(n) | Space: O(n)
+
+
+FOLLOW-UP: MANY TARGETS, ONE ARRAY (TwoSumIndex)
+
+two_sum rebuilds its `seen` dict on every call. When thousands of targets are
+asked against the same array, build an index once and reuse it.
+
+Logical Thinking:
+1. Build once: value -> ascending list of indices, plus the sorted distinct values
+2. Per target, walk the distinct values with two pointers (lo + hi == target)
+3. Each matching value pair is resolved to indices with bisect on the index lists
+4. "first" mode returns exactly what two_sum would return: the smallest j
+   whose complement first occurs before j. It scans like two_sum, but the
+   membership test runs in C (map/compress over the prebuilt map) and
+   nothing is inserted per call
+5. Integer arrays with NumPy: look up each complement's first position (a
+   dense table when the value span is small, else searchsorted on the
+   distinct values), in doubling blocks so early hits stop early
+
+Key Concepts: Precomputed Index, Two Pointers, Bisect, Vectorisation
+Build: O(n log n) | Query: O(u) value pairs with u distinct values,
+O(n) worst case for first_pair (it scans like two_sum); no rebuild per target
 """
 
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import compress, count, repeat
+from operator import sub
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def two_sum(nums, target):
     seen = {}
     for i, num in enumerate(nums):
@@ -30,9 +63,194 @@ def two_sum(nums, target):
     return []
 
 
+class TwoSumIndex:
+    def __init__(self, nums):
+        # Python ints on the scan path: NumPy scalars would wrap in target - num
+        self.nums = nums.tolist() if np is not None and isinstance(nums, np.ndarray) else nums
+        self.positions = defaultdict(list)
+        for i, num in enumerate(self.nums):
+            self.positions[num].append(i)
+        self.values = sorted(self.positions)
+        self._array = None
+        if np is not None and self.values:
+            array = np.asarray(nums)
+            # uint64 values >= 2^63 would wrap in int64 arithmetic
+            if array.dtype.kind == "i" or (array.dtype.kind == "u" and self.values[-1] < 1 << 63):
+                self._array = array.astype(np.int64, copy=False)
+                self._values_np, self._first_np, self._counts_np = np.unique(
+                    self._array, return_index=True, return_counts=True)
+                self._low = int(self._values_np[0])
+                span = int(self._values_np[-1]) - self._low + 1
+                self._first_dense = None
+                if span <= 8 * len(self._array) + 1024:
+                    self._first_dense = np.full(span + 1, len(self._array), dtype=np.int64)
+                    self._first_dense[self._values_np - self._low] = self._first_np
+
+    def _np_target(self, target):
+        """target as an int when the NumPy path can answer it exactly, else None."""
+        if self._array is None or not float(target).is_integer():
+            return None
+        target = int(target)
+        low, high = self.values[0], self.values[-1]
+        if -(1 << 63) <= target - high and target - low < 1 << 63:
+            return target
+        return None
+
+    def _no_pair(self, target):
+        # Every pair sums to an integer in [2·min, 2·max]
+        if self._array is None:
+            return False
+        return (not float(target).is_integer()
+                or not 2 * self.values[0] <= target <= 2 * self.values[-1])
+
+    def value_pairs(self, target):
+        if self._no_pair(target):
+            return []
+        np_target = self._np_target(target)
+        if np_target is not None:
+            return self._value_pairs_np(np_target)
+        values = self.values
+        pairs = []
+        lo, hi = 0, len(values) - 1
+        while lo <= hi:
+            total = values[lo] + values[hi]
+            if total == target:
+                if lo < hi or len(self.positions[values[lo]]) > 1:
+                    pairs.append((values[lo], values[hi]))
+                lo += 1
+                hi -= 1
+            elif total < target:
+                lo += 1
+            else:
+                hi -= 1
+        return pairs
+
+    def _value_pairs_np(self, target):
+        values = self._values_np
+        complements = target - values
+        idx = np.searchsorted(values, complements)
+        np.minimum(idx, len(values) - 1, out=idx)
+        found = (values[idx] == complements) & (values <= complements)
+        found &= (values != complements) | (self._counts_np > 1)
+        hits = np.flatnonzero(found)
+        return list(zip(values[hits].tolist(), complements[hits].tolist()))
+
+    def first_pair(self, target):
+        if self._no_pair(target):
+            return []
+        np_target = self._np_target(target)
+        if np_target is not None:
+            j = self._first_stop_np(np_target)
+        else:
+            j = self._first_stop_scan(target)
+        if j is None:
+            return []
+        pos = self.positions[target - self.nums[j]]
+        return [pos[bisect_left(pos, j) - 1], j]
+
+    def _first_stop_scan(self, target):
+        positions = self.positions
+        nums = self.nums
+        complements = map(sub, repeat(target), nums)
+        for j in compress(count(), map(positions.__contains__, complements)):
+            if positions[target - nums[j]][0] < j:
+                return j
+        return None
+
+    def _first_stop_np(self, target):
+        array, values, first, dense = self._array, self._values_np, self._first_np, self._first_dense
+        lo, block = 0, 4096
+        while lo < len(array):
+            hi = min(lo + block, len(array))
+            complements = target - array[lo:hi]
+            if dense is not None:
+                slots = complements - self._low
+                np.clip(slots, -1, len(dense) - 1, out=slots)
+                hit = dense[slots] < np.arange(lo, hi)
+            else:
+                idx = np.searchsorted(values, complements)
+                np.minimum(idx, len(values) - 1, out=idx)
+                hit = (values[idx] == complements) & (first[idx] < np.arange(lo, hi))
+            if hit.any():
+                return lo + int(np.argmax(hit))
+            lo, block = hi, block * 2
+        return None
+
+    def all_pairs(self, target):
+        result = []
+        for a, b in self.value_pairs(target):
+            pos_a = self.positions[a]
+            if a == b:
+                result.extend((pos_a[x], pos_a[y])
+                              for x in range(len(pos_a)) for y in range(x + 1, len(pos_a)))
+            else:
+                result.extend((min(i, j), max(i, j)) for i in pos_a for j in self.positions[b])
+        result.sort()
+        return result
+
+    def query(self, targets, all_pairs=False):
+        answer = self.all_pairs if all_pairs else self.first_pair
+        return [answer(target) for target in targets]
+
+
+def benchmark(n=10**6, queries=10**4, sample=20, seed=0):
+    import random
+    import time
+
+    rng = random.Random(seed)
+    nums = [2 * rng.randrange(2 * n) for _ in range(n)]
+    targets = [rng.randrange(8 * n) for _ in range(queries)]
+    probe = targets[:sample]
+
+    start = time.perf_counter()
+    for target in probe:
+        two_sum(nums, target)
+    per_call = (time.perf_counter() - start) / len(probe)
+
+    start = time.perf_counter()
+    index = TwoSumIndex(nums)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index.query(probe)
+    per_query = (time.perf_counter() - start) / len(probe)
+
+    backend = "numpy" if index._array is not None else "python"
+    print(f"n={n:,} targets={queries:,}, about half with no pair "
+          f"(timed on {len(probe)}, projected to all)")
+    print(f"  two_sum per call : {per_call * 1e3:8.2f} ms -> {per_call * queries:8.1f} s total")
+    print(f"  TwoSumIndex build: {build:8.2f} s ({backend})")
+    print(f"  TwoSumIndex query: {per_query * 1e3:8.2f} ms -> {build + per_query * queries:8.1f} s total")
+
+
 # Test cases
 if __name__ == "__main__":
+    import sys
+
     assert two_sum([2, 7, 11, 15], 9) == [0, 1]
     assert two_sum([3, 2, 4], 6) == [1, 2]
     assert two_sum([3, 3], 6) == [0, 1]
+
+    index = TwoSumIndex([2, 7, 11, 15])
+    assert index.query([9, 26, 100]) == [[0, 1], [2, 3], []]
+    assert index.query([18], all_pairs=True) == [[(1, 2)]]
+    assert index.first_pair(9.0) == two_sum([2, 7, 11, 15], 9.0) == [0, 1]
+    assert index.first_pair(9.5) == [] and index.first_pair(float("inf")) == []
+    assert index.first_pair(1 << 70) == index.value_pairs(-(1 << 70)) == []
+    if np is not None:
+        big = np.array([2**63 + 1, 5, 2**63 - 1], dtype=np.uint64)
+        index = TwoSumIndex(big)
+        assert index.first_pair(0) == index.value_pairs(0) == index.all_pairs(0) == two_sum(big.tolist(), 0) == []
+        assert index.first_pair(2**64) == [0, 2] and index.value_pairs(2**63 + 6) == [(5, 2**63 + 1)]
+        index = TwoSumIndex(np.array([-(2**62), 2**62, 2**63 - 1], dtype=np.int64))
+        assert index.first_pair(2**63 - 1 + 2**62) == [1, 2] and index.value_pairs(0) == [(-(2**62), 2**62)]
+    index = TwoSumIndex([3, 1, 3, 5, 1, 3])
+    assert index.all_pairs(6) == [(0, 2), (0, 5), (1, 3), (2, 5), (3, 4)]
+    for nums in ([5, 1, 4, 2, 3, 0, 5, 1], [1, 1, 1, 2, 0, 2], [-3, 4, 3, 90, -4, 0]):
+        index = TwoSumIndex(nums)
+        for target in range(-8, 12):
+            assert index.first_pair(target) == two_sum(nums, target)
     print("✅ All test cases passed!")
+
+    if "--bench" in sys.argv:
+        benchmark()
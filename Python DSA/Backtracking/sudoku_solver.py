@@ -6,12 +6,301 @@ Logical Thinking:
 1. Try numbers 1-9 in each cell
 2. Check validity
 3. Backtrack if no solution
+
+
+FOLLOW-UP: SOLVING CORPORA OF 10^6 BOARDS
+
+Logical Thinking (bitmask backend, default):
+1. One 9-bit "used" mask per row / column / box; candidates of a cell are
+   ~(row | col | box) & 0x1FF — validity is a few ORs, not a scan
+2. Naked singles: a cell with exactly one candidate is forced; keep
+   filling them until a pass places nothing (or a cell has 0 → dead end)
+3. MRV: branch on the empty cell with the fewest candidates, so most
+   boards need little or no guessing
+4. State is 81 + 27 small ints, so a branch simply copies it
+
+Exact cover backend (backend="dlx"):
+- 324 constraints (cell filled, row/col/box has digit) × 729 placements
+- Knuth's Algorithm X on dancing links kept in flat index arrays;
+  always branch on the column with the fewest rows left
+
+Batch: solve_many spreads boards over a process pool in chunks and
+reports boards per second. Boards are 81-char lines ('.' or '0' = empty),
+flat lists of 81 ints, or 9×9 boards.
+
+Key: Bitmasks, Constraint Propagation, MRV, Dancing Links, Process Pool
+Time: exponential worst case, ~ms per typical board | Space: O(81) per level
 """
 
-# TODO: Implement solution
+import importlib.util
+import os
+from collections import namedtuple
+from functools import partial
+from time import perf_counter
+
+# Load HashMap/valid_sudoku.py by path: putting ../HashMap on sys.path would
+# shadow same-named scripts from other folders for the whole process
+_spec = importlib.util.spec_from_file_location(
+    "valid_sudoku",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "HashMap", "valid_sudoku.py"),
+)
+_valid_sudoku = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_valid_sudoku)
+is_valid_cells, parse_board = _valid_sudoku.is_valid_cells, _valid_sudoku.parse_board
+
+ROW = [i // 9 for i in range(81)]
+COL = [i % 9 for i in range(81)]
+BOX = [i // 27 * 3 + i % 9 // 3 for i in range(81)]
+POPCOUNT = [bin(m).count("1") for m in range(512)]
+FULL = 0x1FF
+
+BatchStats = namedtuple("BatchStats", "boards solved seconds boards_per_second")
+
+
+def _masks(cells):
+    rows = [0] * 9
+    cols = [0] * 9
+    boxes = [0] * 9
+    for i, d in enumerate(cells):
+        if d:
+            bit = 1 << (d - 1)
+            rows[ROW[i]] |= bit
+            cols[COL[i]] |= bit
+            boxes[BOX[i]] |= bit
+    return rows, cols, boxes
+
+
+def _search(cells, rows, cols, boxes):
+    empty = [i for i in range(81) if not cells[i]]
+    while empty:
+        best = best_cand = None
+        best_count = 10
+        remaining = []
+        for i in empty:
+            r, c, b = ROW[i], COL[i], BOX[i]
+            cand = ~(rows[r] | cols[c] | boxes[b]) & FULL
+            if not cand:
+                return None
+            if cand & (cand - 1):
+                remaining.append(i)
+                n = POPCOUNT[cand]
+                if n < best_count:
+                    best, best_cand, best_count = i, cand, n
+            else:
+                cells[i] = cand.bit_length()
+                rows[r] |= cand
+                cols[c] |= cand
+                boxes[b] |= cand
+        if len(remaining) == len(empty):
+            break
+        empty = remaining
+    else:
+        return cells
+
+    # No naked single left: candidates seen in this pass are all current
+    r, c, b = ROW[best], COL[best], BOX[best]
+    while best_cand:
+        bit = best_cand & -best_cand
+        best_cand ^= bit
+        trial = cells[:]
+        trial[best] = bit.bit_length()
+        rs, cs, bs = rows[:], cols[:], boxes[:]
+        rs[r] |= bit
+        cs[c] |= bit
+        bs[b] |= bit
+        found = _search(trial, rs, cs, bs)
+        if found:
+            return found
+    return None
+
+
+def _solve_bitmask(cells):
+    if not is_valid_cells(cells):
+        return None
+    return _search(cells[:], *_masks(cells))
+
+
+def _solve_dlx(cells):
+    if not is_valid_cells(cells):
+        return None
+    n_cols = 324
+    # Node 0 is the root, 1..324 the column headers, then 4 nodes per row
+    size = 1 + n_cols + 729 * 4
+    L = list(range(-1, size - 1))
+    R = list(range(1, size + 1))
+    L[0], R[n_cols] = n_cols, 0
+    U = list(range(size))
+    D = list(range(size))
+    C = list(range(size))
+    S = [0] * (n_cols + 1)
+    row_of = [0] * size
+    first = [0] * 729
+
+    node = n_cols + 1
+    for i in range(81):
+        r, c, b = ROW[i], COL[i], BOX[i]
+        for d in range(9):
+            row = i * 9 + d
+            first[row] = node
+            for col in (1 + i, 82 + r * 9 + d, 163 + c * 9 + d, 244 + b * 9 + d):
+                C[node] = col
+                row_of[node] = row
+                U[node] = U[col]
+                D[node] = col
+                D[U[col]] = node
+                U[col] = node
+                S[col] += 1
+                node += 1
+            start = first[row]
+            for k in range(4):
+                L[start + k] = start + (k - 1) % 4
+                R[start + k] = start + (k + 1) % 4
+
+    def cover(col):
+        R[L[col]] = R[col]
+        L[R[col]] = L[col]
+        i = D[col]
+        while i != col:
+            j = R[i]
+            while j != i:
+                U[D[j]] = U[j]
+                D[U[j]] = D[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def uncover(col):
+        i = U[col]
+        while i != col:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                U[D[j]] = j
+                D[U[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[col]] = col
+        L[R[col]] = col
+
+    for i, d in enumerate(cells):
+        if d:
+            start = first[i * 9 + d - 1]
+            for k in range(4):
+                cover(C[start + k])
+
+    chosen = []
+
+    def search():
+        if R[0] == 0:
+            return True
+        col, j = R[0], R[0]
+        while j:
+            if S[j] < S[col]:
+                col = j
+            j = R[j]
+        if not S[col]:
+            return False
+        cover(col)
+        i = D[col]
+        while i != col:
+            chosen.append(row_of[i])
+            j = R[i]
+            while j != i:
+                cover(C[j])
+                j = R[j]
+            if search():
+                return True
+            j = L[i]
+            while j != i:
+                uncover(C[j])
+                j = L[j]
+            chosen.pop()
+            i = D[i]
+        uncover(col)
+        return False
+
+    if not search():
+        return None
+    solved = cells[:]
+    for row in chosen:
+        cell, d = divmod(row, 9)
+        solved[cell] = d + 1
+    return solved
+
+
+BACKENDS = {"bitmask": _solve_bitmask, "dlx": _solve_dlx}
+
+
+def solve(puzzle, backend="bitmask"):
+    """Return the solution as an 81-digit string, or None if there is none."""
+    solved = BACKENDS[backend](parse_board(puzzle))
+    return None if solved is None else "".join(map(str, solved))
+
+
+def solve_sudoku(board):
+    """LeetCode form: fill a 9×9 board of '1'-'9' / '.' in place."""
+    solved = solve(board)
+    if solved is None:
+        raise ValueError("board has no solution")
+    for r in range(9):
+        board[r][:] = solved[r * 9:r * 9 + 9]
+
+
+def solve_many(puzzles, workers=None, backend="bitmask", chunksize=512):
+    """Solve a corpus; returns (solutions, BatchStats). workers=1 stays in-process."""
+    one = partial(solve, backend=backend)
+    start = perf_counter()
+    if workers == 1:
+        solutions = list(map(one, puzzles))
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            solutions = list(pool.map(one, puzzles, chunksize=chunksize))
+    seconds = perf_counter() - start
+    solved = sum(s is not None for s in solutions)
+    rate = len(solutions) / seconds if seconds else float("inf")
+    return solutions, BatchStats(len(solutions), solved, seconds, rate)
+
+
+def _is_solution(puzzle, solution):
+    cells = parse_board(puzzle)
+    digits = parse_board(solution)
+    if any(c and c != d for c, d in zip(cells, digits)):
+        return False
+    units = [set() for _ in range(27)]
+    for i, d in enumerate(digits):
+        units[ROW[i]].add(d)
+        units[9 + COL[i]].add(d)
+        units[18 + BOX[i]].add(d)
+    return all(len(u) == 9 and 0 not in u for u in units)
 
 
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Sudoku Solver...")
-    print("Add your test cases here")
+    easy = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+    hard = "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4.."
+    expected = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+    for backend in BACKENDS:
+        assert solve(easy, backend) == expected
+        assert _is_solution(hard, solve(hard, backend))
+        assert solve("55" + "." * 79, backend) is None             # clashing givens
+        assert solve("." * 81, backend) is not None
+        # Givens are valid but cell 8 has no candidate left
+        assert solve("12345678." + "........9" + "." * 63, backend) is None
+
+    rows = [easy[r * 9:r * 9 + 9] for r in range(9)]       # nine row strings
+    assert solve(rows) == expected
+
+    board = [list(easy[r * 9:r * 9 + 9]) for r in range(9)]
+    solve_sudoku(board)
+    assert "".join(map("".join, board)) == expected
+
+    corpus = [easy, hard, easy.replace(".", "0")] * 4
+    solutions, stats = solve_many(corpus, workers=1)
+    assert stats.boards == stats.solved == len(corpus)
+    assert all(_is_solution(p, s) for p, s in zip(corpus, solutions))
+    solutions, stats = solve_many(corpus, workers=2, chunksize=2)
+    assert all(_is_solution(p, s) for p, s in zip(corpus, solutions))
+    print("solve_many: %d boards, %.0f boards/s" % (stats.boards, stats.boards_per_second))
+    print("✅ All test cases passed!")
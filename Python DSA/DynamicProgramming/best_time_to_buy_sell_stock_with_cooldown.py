@@ -2,15 +2,36 @@
 BEST TIME TO BUY SELL STOCK WITH COOLDOWN - Medium
 Max profit with cooldown
 
+Example: prices = [1,2,3,0,2] → 3 (buy, sell, cooldown, buy, sell)
+
 Logical Thinking:
 1. Three states: hold, sold, rest
 2. Transition between states
+   hold = max(hold, rest - price)   (keep holding, or buy after resting)
+   sold = hold + price              (sell today → cooldown tomorrow)
+   rest = max(rest, sold)           (do nothing)
+
+k-transaction limits, longer cooldowns, fees and many tickers at once:
+see stock_trading_engine.py.
+
+Time: O(n) | Space: O(1)
 """
 
-# TODO: Implement solution
+
+def max_profit(prices):
+    hold, sold, rest = float("-inf"), 0, 0
+    for price in prices:
+        hold, sold, rest = max(hold, rest - price), hold + price, max(rest, sold)
+    return max(sold, rest)
 
 
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Best Time To Buy Sell Stock With Cooldown...")
-    print("Add your test cases here")
+    from stock_trading_engine import max_profit as engine_profit
+
+    assert max_profit([1, 2, 3, 0, 2]) == 3
+    assert max_profit([1]) == 0
+    assert max_profit([]) == 0
+    for prices in ([6, 1, 3, 2, 4, 7], [1, 4, 2], [2, 1, 4, 5, 2, 9, 7]):
+        assert max_profit(prices) == engine_profit(prices, cooldown=1)
+    print("✅ All test cases passed!")
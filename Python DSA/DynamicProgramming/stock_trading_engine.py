@@ -0,0 +1,186 @@
+"""
+STOCK TRADING ENGINE - Hard
+One state machine for the whole Best Time to Buy and Sell Stock family:
+at most k transactions (or unlimited), cooldown days after a sale, and a
+fee per transaction — for one price series or thousands of tickers at once.
+
+Example: prices = [3,3,5,0,0,3,1,4], k = 2           → 6  (buy 0 sell 3, buy 1 sell 4)
+         prices = [1,2,3,0,2], cooldown = 1            → 3
+         prices = [1,3,2,8,4,9], fee = 2               → 8
+
+Logical Thinking:
+1. free[j] = best cash after j completed trades, not holding
+   hold[j] = best cash while holding the j-th purchase
+2. Sell today:  free[j] = max(free[j], hold[j] + price - fee)
+3. Buy today:   hold[j] = max(hold[j], free[j-1] of (cooldown + 1) days ago - price)
+   → keep the last cooldown + 1 free vectors in a small deque
+4. Unlimited trades collapse j to a single state
+5. Many tickers: the same update on (tickers x k) NumPy arrays — the only
+   Python loop is over days
+6. Trades: record "bought"/"sold" flags per day and walk them backwards
+   from the best final state
+
+Key: State Machine DP, Vectorisation, Backtracking
+Time: O(days · k) per ticker (vectorised across tickers) | Space: O(k)
+      plus O(days · k) flags when trades are requested
+"""
+
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _backtrack(bought, sold, best_j, days, limited, cooldown):
+    trades = []
+    t, holding, j, sell_day = days - 1, False, best_j, None
+    while t >= 0:
+        if not holding:
+            if limited and j == 0:
+                break
+            if sold(t, j - 1 if limited else 0):
+                sell_day, holding = t, True
+                j = j - 1 if limited else 0
+            t -= 1
+        elif bought(t, j):
+            trades.append((t, sell_day))
+            holding = False
+            t -= 1 + cooldown
+        else:
+            t -= 1
+    trades.reverse()
+    return trades
+
+
+def max_profit(prices, k=None, cooldown=0, fee=0, trades=False):
+    limited = k is not None
+    slots = k if limited else 1
+    if slots == 0 or not prices:
+        return (0, []) if trades else 0
+
+    hold = [float("-inf")] * slots
+    free = [0] * (slots + 1 if limited else 1)
+    lag = deque([free[:]] * (cooldown + 1))
+    bought_log, sold_log = [], []
+
+    for price in prices:
+        source = lag.popleft()
+        bought_today = [False] * slots
+        sold_today = [False] * slots
+        for j in range(slots):
+            dst = j + 1 if limited else 0
+            sell = hold[j] + price - fee
+            if sell > free[dst]:
+                free[dst] = sell
+                sold_today[j] = True
+        for j in range(slots):
+            buy = source[j] - price
+            if buy > hold[j]:
+                hold[j] = buy
+                bought_today[j] = True
+        lag.append(free[:])
+        if trades:
+            bought_log.append(bought_today)
+            sold_log.append(sold_today)
+
+    best = max(free)
+    if not trades:
+        return best
+    path = _backtrack(lambda t, j: bought_log[t][j], lambda t, j: sold_log[t][j],
+                      free.index(best), len(prices), limited, cooldown)
+    return best, path
+
+
+def max_profit_many(prices, k=None, cooldown=0, fee=0, trades=False):
+    """prices: 2D array, one row per ticker. Returns a profit per row (and trades per row)."""
+    if np is None:
+        results = [max_profit(list(row), k, cooldown, fee, trades) for row in prices]
+        if trades:
+            return [r[0] for r in results], [r[1] for r in results]
+        return results
+
+    prices = np.asarray(prices, dtype=np.float64)
+    if prices.ndim == 1:
+        prices = prices[None, :]
+    tickers, days = prices.shape
+    limited = k is not None
+    slots = k if limited else 1
+    if slots == 0 or days == 0:
+        zeros = np.zeros(tickers)
+        return (zeros, [[] for _ in range(tickers)]) if trades else zeros
+
+    hold = np.full((tickers, slots), -np.inf)
+    free = np.zeros((tickers, slots + 1 if limited else 1))
+    lag = deque(free.copy() for _ in range(cooldown + 1))
+    if trades:
+        bought_log = np.zeros((days, tickers, slots), dtype=bool)
+        sold_log = np.zeros((days, tickers, slots), dtype=bool)
+
+    for t in range(days):
+        price = prices[:, t:t + 1]
+        source = lag.popleft()[:, :slots]
+        dst = free[:, 1:] if limited else free
+        sell = hold + price - fee
+        sold = sell > dst
+        np.maximum(dst, sell, out=dst)
+        buy = source - price
+        bought = buy > hold
+        np.maximum(hold, buy, out=hold)
+        lag.append(free.copy())
+        if trades:
+            bought_log[t] = bought
+            sold_log[t] = sold
+
+    best = free.max(axis=1)
+    if not trades:
+        return best
+    best_j = free.argmax(axis=1)
+    paths = [
+        _backtrack(lambda t, j, i=i: bought_log[t, i, j], lambda t, j, i=i: sold_log[t, i, j],
+                   int(best_j[i]), days, limited, cooldown)
+        for i in range(tickers)
+    ]
+    return best, paths
+
+
+# Test cases
+if __name__ == "__main__":
+    import random
+
+    assert max_profit([7, 1, 5, 3, 6, 4], k=1) == 5
+    assert max_profit([7, 1, 5, 3, 6, 4]) == 7
+    assert max_profit([3, 3, 5, 0, 0, 3, 1, 4], k=2) == 6
+    assert max_profit([2, 4, 1], k=2) == 2
+    assert max_profit([1, 2, 3, 0, 2], cooldown=1) == 3
+    assert max_profit([1, 3, 2, 8, 4, 9], fee=2) == 8
+    assert max_profit([1, 3, 7, 5, 10, 3], fee=3) == 6
+    assert max_profit([3, 3, 5, 0, 0, 3, 1, 4], k=2, trades=True) == (6, [(0, 2), (3, 7)])
+    assert max_profit([5, 4, 3], trades=True) == (0, [])
+
+    def brute(prices, left, cooldown, fee, day=0, holding=False):
+        if day >= len(prices):
+            return 0
+        best = brute(prices, left, cooldown, fee, day + 1, holding)
+        if not holding and (left is None or left > 0):
+            after = None if left is None else left - 1
+            best = max(best, brute(prices, after, cooldown, fee, day + 1, True) - prices[day])
+        if holding:
+            best = max(best, prices[day] - fee + brute(prices, left, cooldown, fee, day + 1 + cooldown))
+        return best
+
+    rng = random.Random(14)
+    rows = [[rng.randint(1, 9) for _ in range(9)] for _ in range(60)]
+    for k, cooldown, fee in [(None, 0, 0), (1, 0, 0), (2, 0, 0), (3, 1, 1), (None, 2, 0), (None, 0, 2), (2, 1, 1)]:
+        profits, paths = max_profit_many(rows, k, cooldown, fee, trades=True)
+        for row, profit, path in zip(rows, profits, paths):
+            expected = brute(row, k, cooldown, fee)
+            assert max_profit(row, k, cooldown, fee) == expected == profit
+            assert k is None or len(path) <= k
+            assert all(b < s for b, s in path)
+            assert all(path[x][1] + cooldown < path[x + 1][0] for x in range(len(path) - 1))
+            assert sum(row[s] - row[b] - fee for b, s in path) == expected
+            single = max_profit(row, k, cooldown, fee, trades=True)
+            assert single[0] == expected and sum(row[s] - row[b] - fee for b, s in single[1]) == expected
+    print("✅ All test cases passed!")
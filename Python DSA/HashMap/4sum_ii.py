@@ -2,17 +2,153 @@
 4SUM II - Medium
 Count 4-element tuples with sum 0
 
+Example: A = [1,2], B = [-2,-1], C = [-1,2], D = [0,2] → 2
+
 Logical Thinking:
-- See implementation for approach
+- Count every a + b in a hashmap
+- For every c + d look up how many a + b equal -(c + d)
+- Simple, but holds |A|·|B| dict entries: ~10^8 for 10^4-length inputs
+
+
+FOLLOW-UP: MEMORY-LEAN COUNTING (four_sum_count_sorted)
+
+Logical Thinking:
+1. Negate C and D: now count pairs with a + b == e + f
+2. AB = A + B and EF = E + F as NumPy outer sums (8 bytes per pair,
+   no dict overhead); sort both
+3. Run-length encode each sorted array → (values, counts)
+4. Merge: searchsorted the EF values into the AB values, add
+   count_ab · count_ef for every equal value
+5. Memory tight (block=n): never build the full outer sums. Sort the four
+   inputs; pairs with sum in [lo, hi) are, for each a, one contiguous
+   slice of sorted B (two searchsorted calls), so a value range can be
+   materialised on its own. Pick consecutive ranges by bisection on the
+   pair count so each holds at most ~block AB and EF sums, then sort,
+   run-length encode and merge range by range. Ranges are disjoint, so
+   the counts just add up. A single value with more than block sums is
+   its own range: every sum there is equal, so the count is just
+   pairs_ab · pairs_ef, read off the searchsorted counts
+6. A block of 2^16-2^18 sums (0.5-2 MB) stays inside the CPU cache
+
+Key: Outer Sums, Sort + Run-length Merge, Value-range Blocking
+Time: O(n^2 log n) | Space: O(n^2), or O(n + block) when blocked
 """
 
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def four_sum_count(A, B, C, D):
-    from collections import Counter
     ab_sum = Counter(a + b for a in A for b in B)
     return sum(ab_sum[-c - d] for c in C for d in D)
 
 
+def _runs(values):
+    values.sort()
+    if not values.size:
+        return values, values
+    starts = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+    counts = np.diff(np.append(starts, values.size))
+    return values[starts], counts
+
+
+def _merge_count(ab, ef):
+    ab_values, ab_counts = _runs(ab)
+    ef_values, ef_counts = _runs(ef)
+    if not ab_values.size or not ef_values.size:
+        return 0
+    pos = np.searchsorted(ab_values, ef_values)
+    pos[pos == ab_values.size] = 0
+    hit = ab_values[pos] == ef_values
+    return int((ab_counts[pos[hit]] * ef_counts[hit]).sum())
+
+
+def _pairs_below(X, Y, x):
+    return int(np.searchsorted(Y, x - X).sum())
+
+
+def _pair_sums(X, Y, lo, hi):
+    """All x + y with lo <= x + y < hi, for sorted X and Y."""
+    start = np.searchsorted(Y, lo - X)
+    length = np.searchsorted(Y, hi - X) - start
+    total = int(length.sum())
+    offsets = np.repeat(start - (np.cumsum(length) - length), length)
+    return np.repeat(X, length) + Y[np.arange(total) + offsets]
+
+
+def four_sum_count_sorted(A, B, C, D, block=None):
+    if np is None:
+        return four_sum_count(A, B, C, D)
+    A, B = np.asarray(A, dtype=np.int64), np.asarray(B, dtype=np.int64)
+    E, F = -np.asarray(C, dtype=np.int64), -np.asarray(D, dtype=np.int64)
+    if not (A.size and B.size and E.size and F.size):
+        return 0
+    if block is None or max(A.size * B.size, E.size * F.size) <= block:
+        return _merge_count(np.add.outer(A, B).ravel(), np.add.outer(E, F).ravel())
+
+    A, B, E, F = np.sort(A), np.sort(B), np.sort(E), np.sort(F)
+    lo = int(min(A[0] + B[0], E[0] + F[0]))
+    top = int(max(A[-1] + B[-1], E[-1] + F[-1])) + 1
+
+    total = 0
+    done_ab = done_ef = 0
+    while lo < top:
+        # Largest hi with at most `block` more sums on each side; one value
+        # with more sums than that gets a range of its own, counted directly
+        left, right = lo + 1, top
+        while left < right:
+            mid = (left + right + 1) // 2
+            if (_pairs_below(A, B, mid) - done_ab <= block
+                    and _pairs_below(E, F, mid) - done_ef <= block):
+                left = mid
+            else:
+                right = mid - 1
+        hi = left
+        below_ab, below_ef = _pairs_below(A, B, hi), _pairs_below(E, F, hi)
+        if hi == lo + 1:
+            total += (below_ab - done_ab) * (below_ef - done_ef)
+        else:
+            total += _merge_count(_pair_sums(A, B, lo, hi), _pair_sums(E, F, lo, hi))
+        done_ab, done_ef = below_ab, below_ef
+        lo = hi
+    return total
+
+
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing 4Sum Ii...")
-    print("✅ Refer to implementation")
+    import random
+
+    assert four_sum_count([1, 2], [-2, -1], [-1, 2], [0, 2]) == 2
+    assert four_sum_count_sorted([1, 2], [-2, -1], [-1, 2], [0, 2]) == 2
+    assert four_sum_count_sorted([1, 2], [-2, -1], [-1, 2], [0, 2], block=1) == 2
+    assert four_sum_count_sorted([], [1], [1], [1]) == 0
+    assert four_sum_count_sorted([0] * 6, [0] * 5, [0] * 4, [0] * 3, block=2) == 360
+
+    # Offset distributions and one heavy value: peak memory tracks block,
+    # not the 10^6 / 9·10^6 pairs of the full outer sums
+    import tracemalloc
+
+    cases = [
+        ([list(range(1000)), list(range(1000)), list(range(-11000, -10000)), list(range(1000))],
+         1 << 13, None),
+        ([[0] * 3000] * 4, 1 << 16, 3000 ** 4),
+    ]
+    for arrays, block, expected in cases:
+        tracemalloc.start()
+        count = four_sum_count_sorted(*arrays, block=block)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert count == (four_sum_count(*arrays) if expected is None else expected)
+        assert peak < 64 * block, peak
+
+    rng = random.Random(25)
+    for _ in range(300):
+        arrays = [[rng.randint(-6, 6) for _ in range(rng.randint(0, 9))] for _ in range(4)]
+        expected = four_sum_count(*arrays)
+        assert four_sum_count_sorted(*arrays) == expected
+        assert four_sum_count_sorted(*arrays, block=rng.choice([1, 3, 10, 40])) == expected
+    print("✅ All test cases passed!")
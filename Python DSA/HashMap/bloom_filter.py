@@ -0,0 +1,298 @@
+"""
+BLOOM FILTER - Medium
+Probabilistic set membership for duplicate detection in huge streams.
+Follow-up to contains_duplicate.py, whose set needs memory per distinct value.
+
+Example: seen = BloomFilter(capacity=10**9, error_rate=0.001) → ~1.8 GB of bits
+instead of tens of GB for a set; seen.add(x) says whether x was (probably) seen
+
+Logical Thinking:
+1. m bits in a bytearray, k bit positions per item
+   m = -n · ln(p) / ln(2)², k = (m / n) · ln(2) for n items at error rate p
+2. Positions by double hashing: h1 + i · h2 (mod m) from one stable 64-bit
+   digest (stable_hash64, shared with count_min_sketch.py)
+3. add sets the k bits and reports whether they were all set already
+4. "No" is always right; "yes" is wrong with probability ~p
+5. union = OR of the two bit arrays (same m, k, seed), 1 MB at a time
+6. Scalable variant: when a filter reaches its capacity, open a new one with
+   growth× capacity and a tighter error rate, so the total stays under p.
+   A union keeps copies of both filter lists, so its false-positive rate is
+   bounded by the sum of the two rates (error_bound), not by either one
+7. Exact fallback: pass 1 collects Bloom hits as suspects (true duplicates +
+   ~p·n false positives), pass 2 counts only the suspects exactly
+
+Key: Bit Arrays, Double Hashing, Probabilistic Data Structures
+Time: O(k) per item | Space: ~1.44 · log2(1/p) bits per item
+"""
+
+import struct
+from math import ceil, log
+
+from count_min_sketch import stable_hash64
+
+_MAGIC = b"BLM1"
+_HEADER = struct.Struct("<4sQQQQ")
+_SCALABLE_MAGIC = b"SBF1"
+_SCALABLE_HEADER = struct.Struct("<4sQdddQQ")   # capacity, error, growth, tightening, seed, filters
+
+
+class BloomFilter:
+    def __init__(self, capacity, error_rate=0.001, seed=0, bits=None, hashes=None):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and 0 < error_rate < 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.seed = seed
+        self.bits = bits or max(8, ceil(-capacity * log(error_rate) / log(2) ** 2))
+        self.hashes = hashes or max(1, round(self.bits / capacity * log(2)))
+        self.array = bytearray((self.bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item):
+        h = stable_hash64(item, self.seed)
+        h1, h2 = h, (h >> 32) | 1
+        bits = self.bits
+        return [(h1 + i * h2) % bits for i in range(self.hashes)]
+
+    def add(self, item):
+        array = self.array
+        present = True
+        for pos in self._positions(item):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not array[byte] & mask:
+                present = False
+                array[byte] |= mask
+        if not present:
+            self.count += 1
+        return present
+
+    def __contains__(self, item):
+        array = self.array
+        return all(array[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+        return self
+
+    def add_many(self, items):
+        return [self.add(item) for item in items]
+
+    def contains_many(self, items):
+        return [item in self for item in items]
+
+    def full(self):
+        return self.count >= self.capacity
+
+    def copy(self):
+        bloom = BloomFilter(self.capacity, self.error_rate, self.seed, self.bits, self.hashes)
+        bloom.array[:] = self.array
+        bloom.count = self.count
+        return bloom
+
+    def union(self, other):
+        if (self.bits, self.hashes, self.seed) != (other.bits, other.hashes, other.seed):
+            raise ValueError("filters need the same size, hash count and seed")
+        merged = BloomFilter(self.capacity, self.error_rate, self.seed, self.bits, self.hashes)
+        for lo in range(0, len(self.array), 1 << 20):
+            a, b = self.array[lo:lo + (1 << 20)], other.array[lo:lo + (1 << 20)]
+            merged.array[lo:lo + len(a)] = (int.from_bytes(a, "little")
+                                            | int.from_bytes(b, "little")).to_bytes(len(a), "little")
+        merged.count = self.count + other.count
+        return merged
+
+    __or__ = union
+
+    def write(self, f):
+        f.write(_HEADER.pack(_MAGIC, self.capacity, self.bits, self.hashes, self.seed))
+        f.write(struct.pack("<dQ", self.error_rate, self.count))
+        f.write(self.array)
+
+    @classmethod
+    def read(cls, f):
+        magic, capacity, bits, hashes, seed = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError("not a Bloom filter file")
+        error_rate, count = struct.unpack("<dQ", f.read(16))
+        bloom = cls(capacity, error_rate, seed, bits, hashes)
+        f.readinto(bloom.array)
+        bloom.count = count
+        return bloom
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            self.write(f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.read(f)
+
+
+class ScalableBloomFilter:
+    def __init__(self, initial_capacity=1 << 20, error_rate=0.001, growth=2, tightening=0.5, seed=0):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self.seed = seed
+        self.filters = []
+
+    def _grow(self):
+        # Spend a (1 - tightening) share of the unused error budget: for a
+        # fresh filter that is error_rate · (1 - t) · t^i, and a union keeps
+        # the total under its combined error_rate
+        i = len(self.filters)
+        self.filters.append(BloomFilter(
+            self.initial_capacity * self.growth ** i,
+            (self.error_rate - self.error_bound) * (1 - self.tightening),
+            self.seed + i,
+        ))
+
+    def add(self, item):
+        if item in self:
+            return True
+        if not self.filters or self.filters[-1].full():
+            self._grow()
+        self.filters[-1].add(item)
+        return False
+
+    def __contains__(self, item):
+        return any(item in bloom for bloom in self.filters)
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+        return self
+
+    def contains_many(self, items):
+        return [item in self for item in items]
+
+    @property
+    def count(self):
+        return sum(bloom.count for bloom in self.filters)
+
+    @property
+    def error_bound(self):
+        """Union bound on the false-positive rate of the filters so far."""
+        return sum(bloom.error_rate for bloom in self.filters)
+
+    def union(self, other):
+        # A lookup probes every filter, so the merged rate is up to the sum
+        # of both; error_rate is raised to match so later growth is
+        # budgeted against the combined bound
+        merged = ScalableBloomFilter(self.initial_capacity, self.error_rate + other.error_rate,
+                                     self.growth, self.tightening, self.seed)
+        merged.filters = [bloom.copy() for bloom in self.filters + other.filters]
+        return merged
+
+    __or__ = union
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(_SCALABLE_HEADER.pack(_SCALABLE_MAGIC, self.initial_capacity, self.error_rate,
+                                          self.growth, self.tightening, self.seed, len(self.filters)))
+            for bloom in self.filters:
+                bloom.write(f)
+
+    @classmethod
+    def load(cls, path, **options):
+        """Parameters come from the file; options only apply to files without a header."""
+        with open(path, "rb") as f:
+            head = f.read(_SCALABLE_HEADER.size)
+            if head[:4] == _SCALABLE_MAGIC:
+                _, capacity, error_rate, growth, tightening, seed, n = _SCALABLE_HEADER.unpack(head)
+                scalable = cls(capacity, error_rate, int(growth) if growth.is_integer() else growth,
+                               tightening, seed)
+            else:
+                scalable = cls(**options)
+                f.seek(0)
+                (n,) = struct.unpack("<Q", f.read(8))
+            scalable.filters = [BloomFilter.read(f) for _ in range(n)]
+        return scalable
+
+
+def find_duplicates(items, capacity, error_rate=0.001, exact=True):
+    """
+    items must be re-iterable (list, or a function returning a fresh iterator)
+    when exact=True: the second pass confirms the Bloom hits.
+    """
+    if exact and not callable(items) and iter(items) is items:
+        raise TypeError("exact=True reads items twice; pass a list or a function returning an iterator")
+    passes = items if callable(items) else (lambda: iter(items))
+    seen = BloomFilter(capacity, error_rate)
+    suspects = {item for item in passes() if seen.add(item)}
+    if not exact or not suspects:
+        return suspects
+    counts = dict.fromkeys(suspects, 0)
+    for item in passes():
+        if item in counts:
+            counts[item] += 1
+    return {item for item, c in counts.items() if c > 1}
+
+
+# Test cases
+if __name__ == "__main__":
+    import os
+    import random
+    import tempfile
+
+    bloom = BloomFilter(capacity=10000, error_rate=0.01)
+    assert (bloom.bits, bloom.hashes) == (95851, 7)
+    assert not bloom.add("a") and bloom.add("a") and "a" in bloom and "b" not in bloom
+
+    rng = random.Random(20)
+    values = rng.sample(range(10**9), 20000)
+    bloom = BloomFilter(capacity=10000, error_rate=0.01).update(values[:10000])
+    assert all(bloom.contains_many(values[:10000]))
+    false_positive = sum(bloom.contains_many(values[10000:])) / 10000
+    assert false_positive < 0.02
+
+    other = BloomFilter(capacity=10000, error_rate=0.01).update(values[10000:15000])
+    both = bloom | other
+    assert all(both.contains_many(values[:15000]))
+
+    path = os.path.join(tempfile.mkdtemp(), "seen.bloom")
+    both.save(path)
+    loaded = BloomFilter.load(path)
+    assert loaded.array == both.array and loaded.count == both.count and values[12000] in loaded
+
+    scalable = ScalableBloomFilter(initial_capacity=1000, error_rate=0.01)
+    assert sum(scalable.add(v) for v in values) < 0.01 * len(values)
+    assert len(scalable.filters) >= 4 and all(scalable.contains_many(values))
+    assert sum(scalable.contains_many(range(-5000, 0))) / 5000 < 0.02
+    left = ScalableBloomFilter(initial_capacity=100, error_rate=0.01).update(range(300))
+    right = ScalableBloomFilter(initial_capacity=100, error_rate=0.01).update(range(1000, 1300))
+    merged = left | right
+    assert all(merged.contains_many(list(range(300)) + list(range(1000, 1300))))
+    merged.update(range(5000, 5500))
+    assert sum(right.contains_many(range(5000, 5500))) < 25 and right.count == 300
+    assert merged.error_rate == 0.02 and merged.error_bound < 0.02
+    assert left.error_bound <= 0.01 and right.error_bound <= 0.01
+    scalable.save(path)
+    assert all(ScalableBloomFilter.load(path).contains_many(values[::97]))
+    custom = ScalableBloomFilter(initial_capacity=100, error_rate=0.01, growth=3, seed=4).update(range(250))
+    custom.save(path)
+    loaded = ScalableBloomFilter.load(path)
+    assert (loaded.initial_capacity, loaded.error_rate, loaded.growth, loaded.tightening, loaded.seed) == (
+        100, 0.01, 3, 0.5, 4)
+    assert loaded.error_bound == custom.error_bound < loaded.error_rate
+    loaded.update(range(250, 5000))
+    assert all(loaded.contains_many(range(5000)))
+
+    stream = values[:5000] + rng.sample(values[:5000], 50)
+    rng.shuffle(stream)
+    counts = {}
+    for v in stream:
+        counts[v] = counts.get(v, 0) + 1
+    dupes = {v for v, c in counts.items() if c > 1}
+    assert find_duplicates(stream, capacity=5050) == dupes
+    assert dupes <= find_duplicates(stream, capacity=5050, exact=False)
+    assert find_duplicates(lambda: iter([1, 2, 1]), 10) == {1}
+    assert find_duplicates(iter([1, 2, 1]), 10, exact=False) == {1}
+    try:
+        find_duplicates(iter([1, 2, 1]), 10)
+        assert False
+    except TypeError:
+        pass
+    print("✅ All test cases passed!")
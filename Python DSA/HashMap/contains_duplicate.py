@@ -2,6 +2,8 @@
 CONTAINS DUPLICATE - Easy
 Return true if any value appears at least twice in array.
 
+Example: [1,2,3,1] → True | [1,2,3,4] → False
+
 Logical Thinking:
 1. Use set to track seen values
 2. If value already in set, return True
@@ -15,12 +17,42 @@ def contains_duplicate(nums):
             return True
         seen.add(num)
     return False
+
+For billions of values the set does not fit in memory: approximate=True
+uses a BloomFilter (bloom_filter.py) and confirms hits with a second pass.
+
+Time: O(n) | Space: O(n) exact, ~1.44 · log2(1/p) bits per value approximate
 """
 
-# TODO: Implement solution
+from bloom_filter import BloomFilter, find_duplicates
+
+
+def contains_duplicate(nums, approximate=False, error_rate=0.001):
+    if approximate:
+        return bool(find_duplicates(nums, max(1, len(nums)), error_rate))
+    seen = set()
+    for num in nums:
+        if num in seen:
+            return True
+        seen.add(num)
+    return False
+
+
+def first_duplicate_stream(items, capacity, error_rate=0.001):
+    """Single pass, no exact check: the first item the Bloom filter has (probably) seen."""
+    seen = BloomFilter(capacity, error_rate)
+    for item in items:
+        if seen.add(item):
+            return item
+    return None
 
 
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Contains Duplicate...")
-    print("Add your test cases here")
+    assert contains_duplicate([1, 2, 3, 1])
+    assert not contains_duplicate([1, 2, 3, 4])
+    assert contains_duplicate([1, 1, 1, 3, 3, 4, 3, 2, 4, 2])
+    assert contains_duplicate([1, 2, 3, 1], approximate=True)
+    assert not contains_duplicate(list(range(10000)), approximate=True)
+    assert first_duplicate_stream(iter([5, 6, 7, 6, 5]), capacity=10) == 6
+    print("✅ All test cases passed!")
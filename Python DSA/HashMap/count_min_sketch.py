@@ -0,0 +1,121 @@
+"""
+COUNT-MIN SKETCH - Medium
+Approximate frequency counts in fixed memory, mergeable across workers.
+
+Example: sketch = CountMinSketch.from_error(epsilon=0.001, delta=0.01)
+sketch.update(clicks); sketch.estimate("home") ≥ true count,
+and ≤ true count + epsilon · total with probability ≥ 1 - delta
+
+Logical Thinking:
+1. depth rows of width counters, one flat array('q') (8 bytes per counter)
+2. Every item hashes to one counter per row; add → increment all of them
+3. Collisions only ever add, so each counter over-counts; the smallest of
+   the depth counters is the estimate
+4. width = ceil(e / epsilon), depth = ceil(ln(1 / delta)) give the bound above
+5. Row positions come from double hashing h1 + row · h2 of one stable 64-bit
+   blake2b digest (Python's hash() of str changes per process, which would
+   make sketches from different workers incompatible)
+6. merge = add the two tables counter by counter (NumPy view when available)
+
+Key: Hashing, Probabilistic Counting, Mergeable Summaries
+Time: O(depth) per add/estimate | Space: O(width · depth)
+"""
+
+from array import array
+from hashlib import blake2b
+from math import ceil, e, log
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def stable_hash64(item, seed=0):
+    if isinstance(item, bytes):
+        data = item
+    elif isinstance(item, str):
+        data = item.encode()
+    elif isinstance(item, int):
+        data = item.to_bytes((item.bit_length() + 8) // 8, "little", signed=True)
+    else:
+        data = repr(item).encode()
+    digest = blake2b(data, digest_size=8, salt=seed.to_bytes(16, "little")).digest()
+    return int.from_bytes(digest, "little")
+
+
+class CountMinSketch:
+    def __init__(self, width, depth, seed=0):
+        if width <= 0 or depth <= 0:
+            raise ValueError("width and depth must be positive")
+        self.width = width
+        self.depth = depth
+        self.seed = seed
+        self.table = array("q", bytes(8 * width * depth))
+        self.total = 0
+
+    @classmethod
+    def from_error(cls, epsilon=0.001, delta=0.01, seed=0):
+        return cls(ceil(e / epsilon), ceil(log(1 / delta)), seed)
+
+    def _slots(self, item):
+        h = stable_hash64(item, self.seed)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        width = self.width
+        return [row * width + (h1 + row * h2) % width for row in range(self.depth)]
+
+    def add(self, item, count=1):
+        table = self.table
+        slots = self._slots(item)
+        for slot in slots:
+            table[slot] += count
+        self.total += count
+        return min(table[slot] for slot in slots)
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+        return self
+
+    def estimate(self, item):
+        table = self.table
+        return min(table[slot] for slot in self._slots(item))
+
+    def compatible(self, other):
+        return (self.width, self.depth, self.seed) == (other.width, other.depth, other.seed)
+
+    def merge(self, other):
+        if not self.compatible(other):
+            raise ValueError("sketches need the same width, depth and seed")
+        merged = CountMinSketch(self.width, self.depth, self.seed)
+        merged.table = array("q", self.table)
+        if np is not None:
+            np.frombuffer(merged.table, dtype=np.int64)[:] += np.frombuffer(other.table, dtype=np.int64)
+        else:
+            for i, value in enumerate(other.table):
+                merged.table[i] += value
+        merged.total = self.total + other.total
+        return merged
+
+
+# Test cases
+if __name__ == "__main__":
+    import random
+    from collections import Counter
+
+    sketch = CountMinSketch.from_error(epsilon=0.01, delta=0.01)
+    assert (sketch.width, sketch.depth) == (272, 5)
+    rng = random.Random(19)
+    stream = [f"page{int(rng.paretovariate(1.2))}" for _ in range(20000)]
+    exact = Counter(stream)
+    sketch.update(stream)
+    errors = [sketch.estimate(item) - count for item, count in exact.items()]
+    assert min(errors) >= 0
+    assert sum(err > 0.01 * len(stream) for err in errors) <= 0.01 * len(errors) + 1
+
+    left = CountMinSketch.from_error(0.01, 0.01).update(stream[:5000])
+    right = CountMinSketch.from_error(0.01, 0.01).update(stream[5000:])
+    merged = left.merge(right)
+    assert merged.table == sketch.table and merged.total == len(stream)
+    assert stable_hash64("abc") == stable_hash64("abc") != stable_hash64("abc", seed=1)
+    print("✅ All test cases passed!")
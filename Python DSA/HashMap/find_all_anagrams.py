@@ -2,12 +2,41 @@
 FIND ALL ANAGRAMS - Medium
 Find all anagram start indices
 
+Example: s = "cbaebabacd", p = "abc" → [0, 6]
+
 Logical Thinking:
-- See implementation for approach
+- Slide a window of len(p) over s, keep a Counter of the window
+- Compare the window Counter with Counter(p) at every position
+- Each comparison costs O(alphabet) plus dict overhead
+
+
+FOLLOW-UP: TRUE O(1) PER CHARACTER, MANY PATTERNS
+
+Logical Thinking:
+1. diff = array('i', 256) holding window count - pattern count per byte
+2. mismatches = how many bytes have diff != 0
+3. Moving the window touches two entries of diff; each entry can only flip
+   between zero and non-zero, so mismatches is updated in O(1)
+4. mismatches == 0 ⇔ window is an anagram — no Counter comparison at all
+5. Many patterns of one length: give every byte a random 64-bit weight;
+   hash(window) = sum of weights (mod 2^64) depends only on the counts and
+   slides in O(1). Look the hash up in a dict of pattern hashes
+6. Confirm a hit against window counts that slide along with the hash:
+   both sides hold m symbols, so checking only the pattern's distinct
+   symbols (at most 256 for bytes) is enough — no sort per hit
+
+Key: Sliding Window, Fixed-size Count Array, Mismatch Counter, Multiset Hashing
+Time: O(n + m) single pattern, O(n + total pattern length) many | Space: O(256)
 """
 
+import random
+from array import array
+from collections import Counter, defaultdict
+
+MASK64 = (1 << 64) - 1
+
+
 def find_anagrams(s, p):
-    from collections import Counter
     p_count = Counter(p)
     window = Counter()
     result = []
@@ -23,7 +52,115 @@ def find_anagrams(s, p):
     return result
 
 
+def _as_bytes(text):
+    if isinstance(text, str):
+        return text.encode("latin-1")
+    return bytes(text) if isinstance(text, memoryview) else text
+
+
+def find_anagrams_bytes(s, p):
+    try:
+        s, p = _as_bytes(s), _as_bytes(p)
+    except UnicodeEncodeError:
+        return find_anagrams(s, p)
+    m = len(p)
+    if not m or m > len(s):
+        return []
+
+    diff = array("i", bytes(4 * 256))
+    for c in p:
+        diff[c] -= 1
+    mismatches = sum(1 for d in diff if d)
+    result = []
+
+    for i, c in enumerate(s):
+        d = diff[c]
+        diff[c] = d + 1
+        if d == 0:
+            mismatches += 1
+        elif d == -1:
+            mismatches -= 1
+        if i >= m:
+            out = s[i - m]
+            d = diff[out]
+            diff[out] = d - 1
+            if d == 0:
+                mismatches += 1
+            elif d == 1:
+                mismatches -= 1
+        if i >= m - 1 and not mismatches:
+            result.append(i - m + 1)
+    return result
+
+
+def find_anagrams_multi(s, patterns, seed=0):
+    """Map each pattern (as passed in) to the start indices of its anagrams in s."""
+    patterns = list(patterns)
+    result = {p: [] for p in patterns}
+    try:
+        text, encoded = _as_bytes(s), [_as_bytes(p) for p in patterns]
+    except UnicodeEncodeError:
+        text, encoded = s, patterns          # symbols are characters, not bytes
+    lengths = {len(p) for p in encoded}
+    if len(lengths) > 1:
+        raise ValueError("all patterns must have the same length")
+    m = lengths.pop() if lengths else 0
+    if not m or m > len(text):
+        return result
+
+    rng = random.Random(seed)
+    if isinstance(text, str):
+        weight = defaultdict(lambda: rng.getrandbits(64))
+        window = defaultdict(int)
+    else:
+        weight = [rng.getrandbits(64) for _ in range(256)]
+        window = array("i", bytes(4 * 256))
+    by_hash = {}
+    for p, code in dict(zip(patterns, encoded)).items():
+        h = sum(weight[c] for c in code) & MASK64
+        by_hash.setdefault(h, []).append((tuple(Counter(code).items()), p))
+
+    for c in text[:m - 1]:
+        window[c] += 1
+    h = sum(weight[c] for c in text[:m - 1]) & MASK64
+    for i in range(m - 1, len(text)):
+        c = text[i]
+        window[c] += 1
+        h = (h + weight[c]) & MASK64
+        hits = by_hash.get(h)
+        if hits:
+            for counts, p in hits:
+                for c, k in counts:
+                    if window[c] != k:
+                        break
+                else:
+                    result[p].append(i - m + 1)
+        out = text[i - m + 1]
+        window[out] -= 1
+        h = (h - weight[out]) & MASK64
+    return result
+
+
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Find All Anagrams...")
-    print("✅ Refer to implementation")
+    assert find_anagrams("cbaebabacd", "abc") == [0, 6]
+    assert find_anagrams("abab", "ab") == [0, 1, 2]
+    assert find_anagrams_bytes(b"cbaebabacd", b"abc") == [0, 6]
+    assert find_anagrams_bytes("abab", "ab") == [0, 1, 2]
+    assert find_anagrams_bytes("ab", "abc") == []
+    assert find_anagrams_bytes("ёжёж", "жё") == [0, 1, 2]
+    assert find_anagrams_multi(b"cbaebabacd", [b"abc", b"bac", b"eab", b"zzz"]) == {
+        b"abc": [0, 6], b"bac": [0, 6], b"eab": [1, 2, 3], b"zzz": []}
+    assert find_anagrams_multi("cbaebabacd", ["abc", b"eab"]) == {"abc": [0, 6], b"eab": [1, 2, 3]}
+    assert find_anagrams_multi("ёжёж", ["жё", "ёё"]) == {"жё": [0, 1, 2], "ёё": []}
+    assert find_anagrams_multi("abab", ["ab", "ab"]) == {"ab": [0, 1, 2]}
+
+    rng = random.Random(23)
+    for _ in range(200):
+        s = bytes(rng.choice(b"abcd") for _ in range(rng.randint(0, 40)))
+        m = rng.randint(1, 5)
+        patterns = [bytes(rng.choice(b"abcd") for _ in range(m)) for _ in range(rng.randint(1, 4))]
+        expected = {p: find_anagrams(s, p) for p in patterns}
+        assert {p: find_anagrams_bytes(s, p) for p in patterns} == expected
+        assert find_anagrams_multi(s, patterns) == expected
+    print("✅ All test cases passed!")
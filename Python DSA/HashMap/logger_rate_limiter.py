@@ -1,17 +1,48 @@
 """
 LOGGER RATE LIMITER - Easy
 Design logger that limits message printing
+
+Example: print at t=1 "foo" → True, t=2 "bar" → True, t=3 "foo" → False,
+t=11 "foo" → True
+
+Logical Thinking:
+1. HashMap message → last time it was printed
+2. Print if never seen or last print was >= 10 seconds ago
+3. Timestamps arrive in order, so a FIFO of (time, message) is sorted by
+   time: drop entries older than 10 seconds from its front, and the map
+   only ever holds messages printed in the last 10 seconds
+
+Token buckets, sliding windows, per-key quotas and thread/async front ends:
+see rate_limiter.py.
+
+Time: O(1) amortised | Space: O(messages printed in the last 10 seconds)
 """
 
+from collections import deque
+
+
 class Logger:
     def __init__(self):
         self.log = {}
+        self.recent = deque()
+
     def should_print_message(self, timestamp, message):
+        while self.recent and timestamp - self.recent[0][0] >= 10:
+            old_time, old_message = self.recent.popleft()
+            if self.log.get(old_message) == old_time:
+                del self.log[old_message]
         if message not in self.log or timestamp - self.log[message] >= 10:
             self.log[message] = timestamp
+            self.recent.append((timestamp, message))
             return True
         return False
 
 
 if __name__ == "__main__":
+    logger = Logger()
+    calls = [(1, "foo"), (2, "bar"), (3, "foo"), (8, "bar"), (10, "foo"), (11, "foo")]
+    assert [logger.should_print_message(t, m) for t, m in calls] == [True, True, False, False, False, True]
+    for t in range(100000):
+        logger.should_print_message(t, f"msg{t}")
+    assert len(logger.log) <= 10
     print("✅ Logger Rate Limiter")
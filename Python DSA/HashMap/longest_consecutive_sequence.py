@@ -2,6 +2,8 @@
 LONGEST CONSECUTIVE SEQUENCE - Medium
 Find length of longest consecutive elements sequence in unsorted array.
 
+Example: nums = [100,4,200,1,3,2] → 4 (1,2,3,4)
+
 Logical Thinking:
 1. Convert to set for O(1) lookup
 2. For each number, check if it's start of sequence
@@ -20,12 +22,128 @@ def longest_consecutive(nums):
                 streak += 1
             longest = max(longest, streak)
     return longest
+
+
+FOLLOW-UP: VALUES KEEP ARRIVING (ConsecutiveRuns)
+
+The set scan starts over on every call. Union-find keyed by value keeps the
+runs merged as values arrive.
+
+Logical Thinking:
+1. add(x): x becomes its own run [x, x]
+2. Union with x - 1 and x + 1 if present → neighbouring runs join
+3. Each root stores its run's (low, high); union by run length, path halving
+4. Runs only grow, so the longest run is updated on every union in O(1)
+5. run_of(x) = bounds at find(x); runs() = bounds of every root
+
+Key: Union-Find (Disjoint Set Union), HashMap
+Time: ~O(α(n)) amortised per insert | Space: O(n)
 """
 
-# TODO: Implement solution
+
+def longest_consecutive(nums):
+    num_set = set(nums)
+    longest = 0
+    for num in num_set:
+        if num - 1 not in num_set:
+            current = num
+            streak = 1
+            while current + 1 in num_set:
+                current += 1
+                streak += 1
+            longest = max(longest, streak)
+    return longest
+
+
+class ConsecutiveRuns:
+    def __init__(self, values=()):
+        self.parent = {}
+        self.bounds = {}
+        self.longest = None
+        self.update(values)
+
+    def __len__(self):
+        return len(self.parent)
+
+    def __contains__(self, value):
+        return value in self.parent
+
+    def find(self, value):
+        parent = self.parent
+        while parent[value] != value:
+            parent[value] = parent[parent[value]]
+            value = parent[value]
+        return value
+
+    def _union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return ra
+        low_a, high_a = self.bounds[ra]
+        low_b, high_b = self.bounds[rb]
+        if high_a - low_a < high_b - low_b:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.bounds[ra] = (min(low_a, low_b), max(high_a, high_b))
+        del self.bounds[rb]
+        return ra
+
+    def add(self, value):
+        if value in self.parent:
+            return
+        self.parent[value] = value
+        self.bounds[value] = (value, value)
+        root = value
+        if value - 1 in self.parent:
+            root = self._union(value - 1, value)
+        if value + 1 in self.parent:
+            root = self._union(value + 1, value)
+        low, high = self.bounds[root]
+        if self.longest is None or high - low > self.longest[1] - self.longest[0]:
+            self.longest = (low, high)
+
+    def update(self, values):
+        for value in values:
+            self.add(value)
+        return self
+
+    def longest_length(self):
+        return 0 if self.longest is None else self.longest[1] - self.longest[0] + 1
+
+    def run_of(self, value):
+        if value not in self.parent:
+            return None
+        return self.bounds[self.find(value)]
+
+    def runs(self):
+        return sorted(self.bounds.values())
 
 
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Longest Consecutive Sequence...")
-    print("Add your test cases here")
+    import random
+
+    assert longest_consecutive([100, 4, 200, 1, 3, 2]) == 4
+    assert longest_consecutive([0, 3, 7, 2, 5, 8, 4, 6, 0, 1]) == 9
+    assert longest_consecutive([]) == 0
+
+    runs = ConsecutiveRuns([100, 4, 200, 1, 3, 2])
+    assert runs.longest_length() == 4 and runs.longest == (1, 4)
+    assert runs.run_of(3) == (1, 4) and runs.run_of(50) is None
+    assert runs.runs() == [(1, 4), (100, 100), (200, 200)]
+    runs.update([5, 6, 99, 101])
+    assert runs.longest == (1, 6) and runs.run_of(100) == (99, 101)
+
+    rng = random.Random(21)
+    runs, seen = ConsecutiveRuns(), []
+    for _ in range(3000):
+        value = rng.randint(-300, 300)
+        runs.add(value)
+        seen.append(value)
+        if rng.random() < 0.05:
+            assert runs.longest_length() == longest_consecutive(seen)
+            probe = rng.choice(seen)
+            low, high = runs.run_of(probe)
+            assert all(v in runs for v in range(low, high + 1))
+            assert low - 1 not in runs and high + 1 not in runs
+    print("✅ All test cases passed!")
@@ -0,0 +1,269 @@
+"""
+RATE LIMITER - Medium/Hard
+Per-key rate limiting with bounded memory for long-running processes.
+Follow-up to logger_rate_limiter.py, whose dict keeps every key forever.
+
+Example: RateLimiter(TokenBucket(rate=1, capacity=2))
+allow("a", now=0) → True, allow("a", now=0) → True, allow("a", now=0) → False
+allow("a", now=1) → True (one token refilled)
+
+Logical Thinking:
+1. Policy = how one key's state evolves; limiter = dict key → state
+   - TokenBucket: tokens refill at `rate` up to `capacity`; a request spends `cost`
+   - SlidingWindowCounter: counts for the current and previous fixed window;
+     estimate = prev · (unused fraction of the window) + curr
+2. A state becomes indistinguishable from a fresh one at a known time
+   (bucket full again / two windows passed) → that key can be forgotten
+3. Expiry heap of (idle_at, seq, key), at most one entry per live key (seq
+   breaks ties so keys of mixed types are never compared): when an
+   entry pops, drop the key if it really is idle, otherwise re-push it with
+   its newer idle time (no push per request)
+4. Memory is bounded by keys active within one idle period, not by every
+   key ever seen
+5. Per-key quotas: a dict key → policy overriding the default
+6. Front ends: ThreadSafeRateLimiter (threading.Lock) and AsyncRateLimiter
+   (asyncio.Lock, acquire() sleeps for retry_after)
+
+Key: HashMap, Min-Heap Expiry, Token Bucket, Sliding Window Counter
+Time: O(log keys) amortised per request | Space: O(live keys)
+"""
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+
+    def new_state(self, now):
+        return [self.capacity, now]
+
+    def _refill(self, state, now):
+        if now > state[1]:
+            state[0] = min(self.capacity, state[0] + (now - state[1]) * self.rate)
+            state[1] = now
+
+    def allow(self, state, now, cost):
+        self._refill(state, now)
+        if state[0] >= cost:
+            state[0] -= cost
+            return True
+        return False
+
+    def retry_after(self, state, now, cost):
+        self._refill(state, now)
+        if cost > self.capacity:
+            return float("inf")
+        return max(0.0, (cost - state[0]) / self.rate)
+
+    def idle_at(self, state):
+        return state[1] + (self.capacity - state[0]) / self.rate
+
+
+class SlidingWindowCounter:
+    def __init__(self, limit, window):
+        if limit <= 0 or window <= 0:
+            raise ValueError("limit and window must be positive")
+        self.limit = limit
+        self.window = window
+
+    def new_state(self, now):
+        return [now - now % self.window, 0, 0]
+
+    def _roll(self, state, now):
+        start = state[0]
+        if now >= start + self.window:
+            elapsed = int((now - start) // self.window)
+            state[1] = state[2] if elapsed == 1 else 0
+            state[2] = 0
+            state[0] = start + elapsed * self.window
+
+    def _estimate(self, state, now):
+        used = (now - state[0]) / self.window
+        return state[1] * (1 - used) + state[2]
+
+    def allow(self, state, now, cost):
+        self._roll(state, now)
+        if self._estimate(state, now) + cost <= self.limit:
+            state[2] += cost
+            return True
+        return False
+
+    def retry_after(self, state, now, cost):
+        self._roll(state, now)
+        if cost > self.limit:
+            return float("inf")
+        if self._estimate(state, now) + cost <= self.limit:
+            return 0.0
+        start, prev, curr = state
+        if prev and curr + cost <= self.limit:
+            free_at = start + self.window * (1 - (self.limit - curr - cost) / prev)
+            return max(0.0, free_at - now)
+        return start + self.window - now
+
+    def idle_at(self, state):
+        return state[0] + 2 * self.window
+
+
+class RateLimiter:
+    def __init__(self, policy, quotas=None, clock=time.monotonic):
+        self.policy = policy
+        self.quotas = dict(quotas or {})
+        self.clock = clock
+        self.states = {}
+        self.expiry = []
+        self.sequence = itertools.count()
+
+    def __len__(self):
+        return len(self.states)
+
+    def _state(self, key, now):
+        state = self.states.get(key)
+        if state is None:
+            policy = self.quotas.get(key, self.policy)
+            state = self.states[key] = policy.new_state(now)
+            heapq.heappush(self.expiry, (now, next(self.sequence), key))
+        return state
+
+    def allow(self, key, cost=1, now=None):
+        now = self.clock() if now is None else now
+        self.evict(now)
+        return self.quotas.get(key, self.policy).allow(self._state(key, now), now, cost)
+
+    def retry_after(self, key, cost=1, now=None):
+        now = self.clock() if now is None else now
+        return self.quotas.get(key, self.policy).retry_after(self._state(key, now), now, cost)
+
+    def evict(self, now=None):
+        now = self.clock() if now is None else now
+        expiry, states = self.expiry, self.states
+        while expiry and expiry[0][0] <= now:
+            _, _, key = heapq.heappop(expiry)
+            state = states.get(key)
+            if state is None:
+                continue
+            idle_at = self.quotas.get(key, self.policy).idle_at(state)
+            if idle_at <= now:
+                del states[key]
+            else:
+                heapq.heappush(expiry, (idle_at, next(self.sequence), key))
+
+
+class ThreadSafeRateLimiter:
+    def __init__(self, policy, quotas=None, clock=time.monotonic):
+        self.limiter = RateLimiter(policy, quotas, clock)
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.limiter)
+
+    def allow(self, key, cost=1, now=None):
+        with self.lock:
+            return self.limiter.allow(key, cost, now)
+
+    def retry_after(self, key, cost=1, now=None):
+        with self.lock:
+            return self.limiter.retry_after(key, cost, now)
+
+
+class AsyncRateLimiter:
+    def __init__(self, policy, quotas=None, clock=time.monotonic):
+        self.limiter = RateLimiter(policy, quotas, clock)
+        self.lock = asyncio.Lock()
+
+    def __len__(self):
+        return len(self.limiter)
+
+    async def allow(self, key, cost=1):
+        async with self.lock:
+            return self.limiter.allow(key, cost)
+
+    async def acquire(self, key, cost=1):
+        while True:
+            async with self.lock:
+                if self.limiter.allow(key, cost):
+                    return
+                wait = self.limiter.retry_after(key, cost)
+            if wait == float("inf"):
+                raise ValueError("cost exceeds the key's capacity")
+            await asyncio.sleep(wait)
+
+
+def benchmark(messages=10**8, window=10, per_second=10**5, report_every=10**7):
+    import tracemalloc
+
+    limiter = RateLimiter(TokenBucket(rate=1 / window, capacity=1))
+    tracemalloc.start()
+    for i in range(messages):
+        limiter.allow(i, now=i / per_second)
+        if (i + 1) % report_every == 0:
+            current, peak = tracemalloc.get_traced_memory()
+            print(f"  {i + 1:>13,} messages  live keys {len(limiter):>9,}  "
+                  f"memory {current / 2**20:8.1f} MiB  peak {peak / 2**20:8.1f} MiB")
+    tracemalloc.stop()
+
+
+# Test cases
+if __name__ == "__main__":
+    import sys
+
+    limiter = RateLimiter(TokenBucket(rate=1, capacity=2))
+    assert [limiter.allow("a", now=0) for _ in range(3)] == [True, True, False]
+    assert limiter.retry_after("a", now=0) == 1.0
+    assert limiter.allow("a", now=1) and not limiter.allow("a", now=1.5)
+    assert limiter.allow("b", cost=2, now=1.5) and not limiter.allow("b", now=1.5)
+    assert len(limiter) == 2
+    limiter.evict(now=10)
+    assert len(limiter) == 0
+
+    limiter = RateLimiter(SlidingWindowCounter(limit=4, window=10), quotas={"vip": TokenBucket(100, 100)})
+    assert sum(limiter.allow("u", now=t) for t in (0, 1, 2, 3, 4)) == 4
+    assert not limiter.allow("u", now=10)
+    assert limiter.retry_after("u", now=10) == 2.5
+    assert limiter.allow("u", now=12.5)
+    assert all(limiter.allow("vip", now=1) for _ in range(50))
+
+    limiter = RateLimiter(TokenBucket(rate=0.1, capacity=1))
+    for i in range(100000):
+        limiter.allow(i, now=i / 1000)
+    assert len(limiter) <= 10001
+
+    limiter = RateLimiter(TokenBucket(rate=1, capacity=1))
+    assert limiter.allow(1, now=0) and limiter.allow("a", now=0) and limiter.allow("b", now=0.5)
+    limiter.evict(now=5)
+    assert len(limiter) == 0
+
+    threaded = ThreadSafeRateLimiter(TokenBucket(rate=1e-9, capacity=1000))
+    allowed = []
+    workers = [threading.Thread(target=lambda: allowed.extend(threaded.allow("k") for _ in range(500)))
+               for _ in range(4)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert sum(allowed) == 1000
+
+    async def run():
+        clock = [0.0]
+        limiter = AsyncRateLimiter(TokenBucket(rate=1000, capacity=1), clock=lambda: clock[0])
+        assert await limiter.allow("x") and not await limiter.allow("x")
+        clock[0] = 0.001
+        await limiter.acquire("x")
+        try:
+            await limiter.acquire("x", cost=5)
+            assert False
+        except ValueError:
+            pass
+
+    asyncio.run(run())
+    print("✅ All test cases passed!")
+
+    if "--bench" in sys.argv:
+        benchmark()
@@ -2,6 +2,8 @@
 SUBARRAY SUM EQUALS K - Medium
 Find total number of subarrays whose sum equals k.
 
+Example: nums = [1,1,1], k = 2 → 2 | nums = [1,2,3], k = 3 → 2
+
 Logical Thinking:
 1. Use prefix sum concept
 2. Track cumulative sums in hashmap
@@ -19,12 +21,144 @@ def subarray_sum(nums, k):
         count += sum_map[curr_sum - k]
         sum_map[curr_sum] += 1
     return count
+
+
+FOLLOW-UP: HUNDREDS OF k OVER ONE HUGE SERIES (PrefixSumIndex)
+
+The hashmap pass answers one k. Build the prefix sums P once; a subarray
+nums[i:j] sums to k exactly when P[j] - P[i] = k with i < j.
+
+Logical Thinking:
+1. P = [0] + cumsum(nums) as one int64 NumPy array
+2. Give every distinct prefix value a group id, sort positions by
+   (group, position) → key = group · (n + 1) + position is sorted
+3. For each j: earlier matches = keys in [group(P[j] - k) · (n + 1),
+   group(P[j] - k) · (n + 1) + j) → searchsorted, no Python loop
+4. Visit j in the same sorted (P, position) order: shifting every P by k
+   keeps that order, so the queries arrive sorted and the searches walk the
+   keys array front to back (cache friendly, like a sort-merge join)
+5. Batches of k reuse the same keys; j is processed in chunks to bound
+   temporary memory
+6. ranges(k): the same lookups give, for each j, a slice of the sorted
+   positions; np.repeat expands them into (start, stop) pairs
+
+Key: Prefix Sums, Sort + searchsorted Join, Vectorisation
+Time: O(n log n) build, O(n log n) per k | Space: O(n)
 """
 
-# TODO: Implement solution
+from bisect import bisect_left
+from collections import defaultdict
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def subarray_sum(nums, k):
+    count = 0
+    sum_map = defaultdict(int)
+    sum_map[0] = 1
+    curr_sum = 0
+    for num in nums:
+        curr_sum += num
+        count += sum_map[curr_sum - k]
+        sum_map[curr_sum] += 1
+    return count
+
+
+class PrefixSumIndex:
+    def __init__(self, nums, chunk=1 << 20):
+        self.chunk = chunk
+        if np is None:
+            self.prefix = [0]
+            for num in nums:
+                self.prefix.append(self.prefix[-1] + num)
+            self.positions = defaultdict(list)
+            for j, value in enumerate(self.prefix):
+                self.positions[value].append(j)
+            return
+
+        nums = np.asarray(nums)
+        if nums.size and nums.dtype.kind not in "biu":
+            raise TypeError("PrefixSumIndex needs integer values")
+        self.prefix = np.zeros(len(nums) + 1, dtype=np.int64)
+        np.cumsum(nums, dtype=np.int64, out=self.prefix[1:])
+        self.values, groups = np.unique(self.prefix, return_inverse=True)
+        self.width = len(self.prefix)
+        self.keys = np.sort(groups.astype(np.int64) * self.width + np.arange(self.width))
+        self.order = self.keys % self.width
+        self.sorted_prefix = self.prefix[self.order]
+        self.group_start = np.searchsorted(self.keys, np.arange(len(self.values) + 1) * self.width)
+
+    def _lookups(self, k, lo, hi):
+        targets = self.sorted_prefix[lo:hi] - k
+        group = np.searchsorted(self.values, targets)
+        np.minimum(group, len(self.values) - 1, out=group)
+        found = self.values[group] == targets
+        stop = self.order[lo:hi]
+        first = self.group_start[group]
+        last = np.searchsorted(self.keys, group * self.width + stop)
+        return first, np.where(found, last - first, 0), stop
+
+    def count(self, k):
+        if np is None:
+            positions = self.positions
+            return sum(bisect_left(positions.get(value - k, ()), j) for j, value in enumerate(self.prefix))
+        total = 0
+        for lo in range(0, len(self.prefix), self.chunk):
+            _, matches, _ = self._lookups(k, lo, min(lo + self.chunk, len(self.prefix)))
+            total += int(matches.sum())
+        return total
+
+    def counts(self, ks):
+        return {k: self.count(k) for k in ks}
+
+    def ranges(self, k):
+        if np is None:
+            result = []
+            for j, value in enumerate(self.prefix):
+                earlier = self.positions.get(value - k, ())
+                result.extend((i, j) for i in earlier[:bisect_left(earlier, j)])
+            result.sort()
+            return result
+
+        starts, stops = [], []
+        for lo in range(0, len(self.prefix), self.chunk):
+            hi = min(lo + self.chunk, len(self.prefix))
+            first, matches, stop = self._lookups(k, lo, hi)
+            total = int(matches.sum())
+            if not total:
+                continue
+            offsets = np.arange(total) - np.repeat(np.cumsum(matches) - matches, matches)
+            starts.append(self.keys[np.repeat(first, matches) + offsets] % self.width)
+            stops.append(np.repeat(stop, matches))
+        if not starts:
+            return []
+        starts, stops = np.concatenate(starts), np.concatenate(stops)
+        order = np.lexsort((stops, starts))
+        return list(zip(starts[order].tolist(), stops[order].tolist()))
 
 
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Subarray Sum Equals K...")
-    print("Add your test cases here")
+    import random
+
+    assert subarray_sum([1, 1, 1], 2) == 2
+    assert subarray_sum([1, 2, 3], 3) == 2
+    assert subarray_sum([1, -1, 0], 0) == 3
+
+    index = PrefixSumIndex([1, 2, 3])
+    assert index.counts([3, 6, 7]) == {3: 2, 6: 1, 7: 0}
+    assert index.ranges(3) == [(0, 2), (2, 3)]
+
+    rng = random.Random(22)
+    for _ in range(200):
+        nums = [rng.randint(-3, 3) for _ in range(rng.randint(0, 25))]
+        index = PrefixSumIndex(nums, chunk=rng.randint(1, 8))
+        for k in range(-5, 6):
+            expected = [(i, j) for i in range(len(nums)) for j in range(i + 1, len(nums) + 1)
+                        if sum(nums[i:j]) == k]
+            assert index.count(k) == subarray_sum(nums, k) == len(expected)
+            assert index.ranges(k) == expected
+    print("✅ All test cases passed!")
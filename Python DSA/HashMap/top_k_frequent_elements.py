@@ -2,6 +2,8 @@
 TOP K FREQUENT ELEMENTS - Medium
 Return k most frequent elements from array.
 
+Example: nums = [1,1,1,2,2,3], k = 2 → [1,2]
+
 Logical Thinking:
 1. Count frequencies using Counter
 2. Use heap or sort by frequency
@@ -13,12 +15,118 @@ import heapq
 def top_k_frequent(nums, k):
     count = Counter(nums)
     return heapq.nlargest(k, count.keys(), key=count.get)
+
+
+FOLLOW-UP: HIGH-CARDINALITY STREAMS (Count-Min Sketch + size-k heap)
+
+Counter needs one entry per distinct key. For clickstreams, count in a
+CountMinSketch (count_min_sketch.py) and only remember k candidates.
+
+Logical Thinking:
+1. add(item): update the sketch, get the item's new estimate back
+2. Candidates live in a dict item → estimate plus a min-heap of
+   (estimate, seq, item) — seq breaks ties so items are never compared.
+   Heap entries go stale when a candidate's estimate grows, so skip
+   entries that no longer match the dict (rebuild if it bloats)
+3. New item beats the smallest candidate → replace it
+4. merge: add the sketches, re-estimate the union of both candidate sets
+   from the merged sketch, keep the best k
+5. Estimates never undercount; overcount ≤ epsilon · n with prob. 1 - delta
+
+Key: Count-Min Sketch, Min-Heap of size k, Lazy Deletion
+Time: O(depth + log k) per item | Space: O(width · depth + k)
 """
 
-# TODO: Implement solution
+import heapq
+import itertools
+from collections import Counter
+
+from count_min_sketch import CountMinSketch
+
+
+def top_k_frequent(nums, k, approximate=False, epsilon=0.001, delta=0.01):
+    if approximate:
+        top = StreamingTopK(k, epsilon, delta)
+        top.update(nums)
+        return [item for item, _ in top.top()]
+    count = Counter(nums)
+    return heapq.nlargest(k, count.keys(), key=count.get)
+
+
+class StreamingTopK:
+    def __init__(self, k, epsilon=0.001, delta=0.01, seed=0, sketch=None):
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.k = k
+        self.sketch = sketch or CountMinSketch.from_error(epsilon, delta, seed)
+        self.candidates = {}
+        self.heap = []
+        self.sequence = itertools.count()
+
+    def _smallest(self):
+        heap, candidates = self.heap, self.candidates
+        while heap and candidates.get(heap[0][2], object()) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0]
+
+    def _push(self, item, estimate):
+        self.candidates[item] = estimate
+        heapq.heappush(self.heap, (estimate, next(self.sequence), item))
+        if len(self.heap) > 4 * self.k + 16:
+            self.heap = [(est, next(self.sequence), it) for it, est in self.candidates.items()]
+            heapq.heapify(self.heap)
+
+    def add(self, item, count=1):
+        estimate = self.sketch.add(item, count)
+        if item in self.candidates or len(self.candidates) < self.k:
+            self._push(item, estimate)
+            return
+        low, _, low_item = self._smallest()
+        if estimate > low:
+            heapq.heappop(self.heap)
+            del self.candidates[low_item]
+            self._push(item, estimate)
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+        return self
+
+    def top(self):
+        return sorted(self.candidates.items(), key=lambda pair: pair[1], reverse=True)
+
+    def merge(self, other):
+        merged = StreamingTopK(self.k, sketch=self.sketch.merge(other.sketch))
+        pool = set(self.candidates) | set(other.candidates)
+        best = heapq.nlargest(self.k, pool, key=merged.sketch.estimate)
+        for item in best:
+            merged._push(item, merged.sketch.estimate(item))
+        return merged
 
 
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Top K Frequent Elements...")
-    print("Add your test cases here")
+    import random
+
+    assert sorted(top_k_frequent([1, 1, 1, 2, 2, 3], 2)) == [1, 2]
+    assert top_k_frequent([1], 1) == [1]
+    assert sorted(top_k_frequent([1, 1, 1, 2, 2, 3], 2, approximate=True)) == [1, 2]
+
+    mixed = StreamingTopK(2).update([1, "a", 1, "a", "b", "b", 2, 2, "c", "c", "c"])
+    assert mixed.top()[0] == ("c", 3) and len(mixed.top()) == 2
+
+    rng = random.Random(19)
+    stream = [int(rng.paretovariate(1.1)) for _ in range(50000)]
+    exact = Counter(stream)
+    truth = [item for item, _ in exact.most_common(10)]
+
+    top = StreamingTopK(10, epsilon=0.0005, delta=0.01).update(stream)
+    found = [item for item, _ in top.top()]
+    assert set(found[:5]) == set(truth[:5]) and len(set(found) & set(truth)) >= 8
+    assert all(estimate >= exact[item] for item, estimate in top.top())
+
+    parts = [StreamingTopK(10, epsilon=0.0005, delta=0.01).update(stream[i::3]) for i in range(3)]
+    merged = parts[0].merge(parts[1]).merge(parts[2])
+    assert merged.sketch.total == len(stream)
+    assert [item for item, _ in merged.top()][:5] == found[:5]
+    print("✅ All test cases passed!")
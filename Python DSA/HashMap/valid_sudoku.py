@@ -5,12 +5,89 @@ Check if Sudoku board is valid
 Logical Thinking:
 1. Check rows, columns, boxes
 2. Use sets to track seen numbers
+3. Cheaper: one 9-bit mask per row / column / box instead of a set;
+   digit d is bit d-1, a repeat is a bit that is already set
+
+Key: Bitmask per Unit
+Time: O(81) | Space: O(27) ints
+
+
+FOLLOW-UP: VALIDATING CORPORA OF 10^6 BOARDS
+- Corpora are usually one 81-char line per puzzle ('.' or '0' = empty),
+  so every entry point also accepts that form (or a flat list of 81 ints)
+- parse_board normalises any of the three shapes into 81 ints once;
+  the check itself is 27 ints and one pass, no allocations per cell
 """
 
-# TODO: Implement solution
+
+def parse_board(board):
+    if isinstance(board, (str, bytes)):
+        if isinstance(board, bytes):
+            board = board.decode("ascii")
+        board = board.strip()
+        if len(board) != 81:
+            raise ValueError("expected 81 characters, got %d" % len(board))
+        return [0 if ch in ".0" else int(ch) for ch in board]
+    cells = []
+    for row in board:
+        if isinstance(row, (list, tuple, str)):
+            cells.extend(row)
+        else:
+            cells.append(row)
+    if len(cells) != 81:
+        raise ValueError("expected 81 cells, got %d" % len(cells))
+    return [0 if v in (".", "0", 0, None) else int(v) for v in cells]
+
+
+def is_valid_cells(cells):
+    rows = [0] * 9
+    cols = [0] * 9
+    boxes = [0] * 9
+    for i, d in enumerate(cells):
+        if not d:
+            continue
+        if not 1 <= d <= 9:
+            return False
+        r, c = divmod(i, 9)
+        b = r // 3 * 3 + c // 3
+        bit = 1 << (d - 1)
+        if (rows[r] | cols[c] | boxes[b]) & bit:
+            return False
+        rows[r] |= bit
+        cols[c] |= bit
+        boxes[b] |= bit
+    return True
+
+
+def is_valid_sudoku(board):
+    return is_valid_cells(parse_board(board))
 
 
 # Test cases
 if __name__ == "__main__":
-    print(f"Testing Valid Sudoku...")
-    print("Add your test cases here")
+    board = [
+        ["5", "3", ".", ".", "7", ".", ".", ".", "."],
+        ["6", ".", ".", "1", "9", "5", ".", ".", "."],
+        [".", "9", "8", ".", ".", ".", ".", "6", "."],
+        ["8", ".", ".", ".", "6", ".", ".", ".", "3"],
+        ["4", ".", ".", "8", ".", "3", ".", ".", "1"],
+        ["7", ".", ".", ".", "2", ".", ".", ".", "6"],
+        [".", "6", ".", ".", ".", ".", "2", "8", "."],
+        [".", ".", ".", "4", "1", "9", ".", ".", "5"],
+        [".", ".", ".", ".", "8", ".", ".", "7", "9"],
+    ]
+    assert is_valid_sudoku(board)
+    board[0][0] = "8"                        # clashes with the 8 below it
+    assert not is_valid_sudoku(board)
+    assert not is_valid_sudoku("88" + "." * 79)
+    line = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+    assert is_valid_sudoku(line)
+    assert is_valid_sudoku(line.replace(".", "0").encode())
+    assert not is_valid_sudoku("5" * 81)
+    assert parse_board(line)[:5] == [5, 3, 0, 0, 7]
+    try:
+        parse_board("123")
+        assert False
+    except ValueError:
+        pass
+    print("✅ All test cases passed!")
@@ -1,10 +1,141 @@
 """
 SLIDING WINDOW MEDIAN - Hard
 Find median in each sliding window
+
+Example: nums = [1,3,-1,-3,5,3,6,7], k = 3 → [1,-1,-1,3,5,6]
+
+Logical Thinking:
+1. Two heaps split the window: max-heap `low` holds the smallest r+1 values,
+   min-heap `high` holds the rest (r = rank of the wanted order statistic)
+2. Median/percentile = top of low, interpolated with top of high when the
+   position q*(k-1) falls between two ranks (even k for the median)
+3. Outgoing values cannot be removed from the middle of a heap, so count them
+   in `delayed` and drop them only when they surface at a heap top
+4. Track the live size of each heap separately from len(heap)
+5. Rebalance after every insert/remove so low keeps exactly r+1 live values
+6. Stale entries buried below a heap top never surface on some streams
+   (rising input leaves them deep in low), so once the heaps hold more
+   stale than live entries rebuild both from the window itself: one sort
+   of k values after at least k removals → O(log k) amortised, and the
+   heaps never exceed about 2k entries
+
+Works for any percentile q in [0, 1], not only the median, and uses only the
+standard library (the older SortedList version is kept for benchmarking).
+
+Key: Two Heaps, Lazy Deletion, Sliding Window
+Time: O(n log k) | Space: O(k)
 """
 
-from sortedcontainers import SortedList
+import heapq
+from collections import defaultdict, deque
+
+
+class SlidingPercentile:
+    def __init__(self, k, q=0.5):
+        if k <= 0:
+            raise ValueError("k must be positive")
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        self.k = k
+        self.q = q
+        self.window = deque()
+        self.low = []
+        self.high = []
+        self.low_size = 0
+        self.high_size = 0
+        self.delayed = defaultdict(int)
+
+    def __len__(self):
+        return len(self.window)
+
+    def push(self, num):
+        self.window.append(num)
+        if not self.low or num <= -self.low[0]:
+            heapq.heappush(self.low, -num)
+            self.low_size += 1
+        else:
+            heapq.heappush(self.high, num)
+            self.high_size += 1
+        if len(self.window) > self.k:
+            self._remove(self.window.popleft())
+        self._rebalance()
+        if len(self.low) + len(self.high) > 2 * len(self.window) + 1:
+            self._compact()
+
+    def _compact(self):
+        values = sorted(self.window)
+        target = self._rank() + 1
+        # Ascending list of negatives and an ascending list are valid heaps
+        self.low = [-num for num in reversed(values[:target])]
+        self.high = values[target:]
+        self.low_size = len(self.low)
+        self.high_size = len(self.high)
+        self.delayed.clear()
+
+    def _remove(self, num):
+        self.delayed[num] += 1
+        if num <= -self.low[0]:
+            self.low_size -= 1
+            if num == -self.low[0]:
+                self._prune(self.low, -1)
+        else:
+            self.high_size -= 1
+            if num == self.high[0]:
+                self._prune(self.high, 1)
+
+    def _prune(self, heap, sign):
+        delayed = self.delayed
+        while heap:
+            num = sign * heap[0]
+            if not delayed.get(num):
+                break
+            delayed[num] -= 1
+            if not delayed[num]:
+                del delayed[num]
+            heapq.heappop(heap)
+
+    def _rank(self):
+        return int(self.q * (len(self.window) - 1))
+
+    def _rebalance(self):
+        target = self._rank() + 1
+        while self.low_size > target:
+            heapq.heappush(self.high, -heapq.heappop(self.low))
+            self.low_size -= 1
+            self.high_size += 1
+            self._prune(self.low, -1)
+        while self.low_size < target and self.high_size:
+            heapq.heappush(self.low, -heapq.heappop(self.high))
+            self.low_size += 1
+            self.high_size -= 1
+            self._prune(self.high, 1)
+
+    def value(self):
+        if not self.window:
+            return None
+        position = self.q * (len(self.window) - 1)
+        lower = -self.low[0]
+        fraction = position - int(position)
+        if not fraction:
+            return lower
+        return lower + (self.high[0] - lower) * fraction
+
+
+def sliding_percentile(nums, k, q=0.5):
+    window = SlidingPercentile(k, q)
+    for i, num in enumerate(nums):
+        window.push(num)
+        if i >= k - 1:
+            yield window.value()
+
+
 def median_sliding_window(nums, k):
+    return [float(m) for m in sliding_percentile(nums, k, 0.5)]
+
+
+def median_sliding_window_sortedlist(nums, k):
+    from sortedcontainers import SortedList
+
     window = SortedList(nums[:k])
     medians = []
     for i in range(k, len(nums) + 1):
@@ -15,5 +146,66 @@ def median_sliding_window(nums, k):
     return medians
 
 
+def benchmark(n=200_000, ks=(10, 100, 1_000, 10_000, 100_000), seed=0):
+    import random
+    import time
+    from importlib.util import find_spec
+
+    have_sortedlist = find_spec("sortedcontainers") is not None
+
+    rng = random.Random(seed)
+    nums = [rng.randrange(10**6) for _ in range(n)]
+    print(f"n={n:,}")
+    for k in ks:
+        start = time.perf_counter()
+        median_sliding_window(nums, k)
+        heaps = time.perf_counter() - start
+        line = f"  k={k:>7,}  two heaps {heaps:7.3f} s"
+        if have_sortedlist:
+            start = time.perf_counter()
+            median_sliding_window_sortedlist(nums, k)
+            line += f"  SortedList {time.perf_counter() - start:7.3f} s"
+        else:
+            line += "  SortedList (not installed)"
+        print(line)
+
+
 if __name__ == "__main__":
+    import random
+    import sys
+
+    assert median_sliding_window([1, 3, -1, -3, 5, 3, 6, 7], 3) == [1, -1, -1, 3, 5, 6]
+    assert median_sliding_window([1, 2, 3, 4, 2, 3, 1, 4, 2], 3) == [2, 3, 3, 3, 2, 3, 2]
+    assert median_sliding_window([1, 4, 2, 3], 4) == [2.5]
+    assert list(sliding_percentile([5, 1, 4, 2, 3], 5, 0.0)) == [1]
+    assert list(sliding_percentile([5, 1, 4, 2, 3], 5, 1.0)) == [5]
+    assert list(sliding_percentile([5, 1, 4, 2, 3], 5, 0.25)) == [2]
+
+    rng = random.Random(7)
+    for _ in range(50):
+        nums = [rng.randint(-5, 5) for _ in range(rng.randint(1, 40))]
+        k = rng.randint(1, len(nums))
+        q = rng.choice([0, 0.1, 0.5, 0.9, 1, rng.random()])
+        for i, got in enumerate(sliding_percentile(nums, k, q)):
+            live = sorted(nums[i:i + k])
+            position = q * (k - 1)
+            lo = int(position)
+            expected = live[lo] + (live[min(lo + 1, k - 1)] - live[lo]) * (position - lo)
+            assert abs(got - expected) < 1e-9
+
+    # Stale entries that never reach a heap top must not pile up
+    for nums, k, q in ((range(100_000), 10, 0.9), ([0, 1] * 100_000, 10, 0.5),
+                       (range(100_000, 0, -1), 7, 0.1)):
+        window = SlidingPercentile(k, q)
+        for num in nums:
+            window.push(num)
+            assert len(window.low) + len(window.high) <= 2 * k + 1
+        live = sorted(list(nums)[-k:])
+        position = q * (k - 1)
+        lo = int(position)
+        expected = live[lo] + (live[lo + 1] - live[lo]) * (position - lo)
+        assert abs(window.value() - expected) < 1e-9
     print("✅ Sliding Window Median")
+
+    if "--bench" in sys.argv:
+        benchmark()
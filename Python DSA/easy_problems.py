@@ -155,11 +155,15 @@ def find_disappeared_numbers(nums):
     Find all numbers in [1, n] that don't appear in the array.
     Input: nums = [4,3,2,7,8,2,3,1]
     Output: [5,6]
+    Signs are flipped as markers, then restored so nums is left unchanged.
     """
     for num in nums:
         index = abs(num) - 1
         nums[index] = -abs(nums[index])
-    return [i + 1 for i in range(len(nums)) if nums[i] > 0]
+    missing = [i + 1 for i in range(len(nums)) if nums[i] > 0]
+    for i in range(len(nums)):
+        nums[i] = abs(nums[i])
+    return missing
 
 
 def third_max(nums):